@@ -6,90 +6,327 @@ for more efficient and reliable file change detection.
 """
 
 import os
+import sys
+import asyncio
 import time
+import pickle
 import threading
-from typing import Callable, Optional
+from collections import deque
+from typing import Callable, List, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
 from log_parser import SCLogParser
 
+# Parser state saved between runs, so restarting skips re-reading an unchanged log
+if os.name == 'nt':
+    STATE_CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'V3SCInfo')
+else:
+    STATE_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'v3scinfo')
+STATE_CACHE_FILE = os.path.join(STATE_CACHE_DIR, 'state.pickle')
+# Bytes at the start of the log and before the cached position that must be unchanged
+# for the cache to be used
+FINGERPRINT_SIZE = 4096
+
+# Errors raised on monitor threads, as (time.monotonic(), message), for the UI to pick up
+# with drain_errors(). Bounded, so a storm of repeated errors only keeps the latest ones.
+_ERR_RING = deque(maxlen=256)
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = sys.platform.startswith('linux')
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+if os.name == 'nt':
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    _GENERIC_READ = 0x80000000
+    _FILE_SHARE_ALL = 0x00000001 | 0x00000002 | 0x00000004  # Read | Write | Delete
+    _OPEN_EXISTING = 3
+    _FILE_ATTRIBUTE_NORMAL = 0x80
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+    )
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+
+def drain_errors() -> List[Tuple[float, str]]:
+    """Take all errors recorded by the monitor threads since the last call, oldest first"""
+    errors = []
+    while True:
+        try:
+            errors.append(_ERR_RING.popleft())
+        except IndexError:
+            return errors
+
+
+def _record_error(message: str) -> None:
+    """Record an error from a monitor thread without writing to stdout"""
+    _ERR_RING.append((time.monotonic(), message))
+
+
+def _open_shared(file_path: str):
+    """Open a file for unbuffered binary reads without locking it.
+    
+    Python's open() on Windows does not allow other processes to delete or rename
+    the file while it is held, which would stop Star Citizen from rotating its
+    Game.log while we keep a handle open.
+    """
+    if os.name != 'nt':
+        return open(file_path, 'rb', buffering=0)
+        
+    handle = _kernel32.CreateFileW(file_path, _GENERIC_READ, _FILE_SHARE_ALL, None,
+                                   _OPEN_EXISTING, _FILE_ATTRIBUTE_NORMAL, None)
+    if handle == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        fd = msvcrt.open_osfhandle(handle, os.O_RDONLY | os.O_BINARY)
+    except OSError:
+        _kernel32.CloseHandle(handle)
+        raise
+    return open(fd, 'rb', buffering=0)
+
+
+class LogTail:
+    """Reads the lines appended to a log file through one persistent handle"""
+    
+    # Fixed attribute layout, this object is touched on every log write
+    __slots__ = ('file_path', 'position', '_file', '_identity', '_buf', '_view', '_tail')
+    
+    READ_SIZE = 65536
+    
+    def __init__(self, file_path: str, position: Optional[int] = None):
+        self.file_path = file_path
+        self._buf = bytearray(self.READ_SIZE)
+        self._view = memoryview(self._buf)
+        self._tail = b''
+        
+        # Start at the end of the file unless told otherwise, only future writes are of interest
+        self._file = _open_shared(self.file_path)
+        self._identity = self._file_identity()
+        if position is None:
+            self.position = self._file.seek(0, os.SEEK_END)
+        else:
+            self.position = self._file.seek(position)
+            
+    @property
+    def parsed_position(self) -> int:
+        """Offset just past the last complete line handed out"""
+        return self.position - len(self._tail)
+        
+    def _file_identity(self) -> tuple:
+        """Device and inode of the open handle"""
+        st = os.fstat(self._file.fileno())
+        return st.st_dev, st.st_ino
+        
+    def _rotated(self) -> bool:
+        """Check whether file_path now names another file than the one held open"""
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return False  # Moved away and not recreated yet, stay on the old file
+        return (st.st_dev, st.st_ino) != self._identity
+        
+    def reopen(self) -> None:
+        """Switch to the file now at file_path and read it from the start"""
+        new_file = _open_shared(self.file_path)
+        self._file.close()
+        self._file = new_file
+        self._identity = self._file_identity()
+        self._tail = b''
+        self.position = 0
+        
+    def read_text(self, limit: Optional[int] = None) -> str:
+        """Read what was appended since the last call and return it as complete lines
+        
+        Reads to the end of the file, or stops once `limit` bytes were read.
+        """
+        # A file shorter than what was already read has been truncated in place
+        if os.fstat(self._file.fileno()).st_size < self.position:
+            self._file.seek(0)
+            self._tail = b''
+            self.position = 0
+            
+        # The first read lands straight in the buffer that gets decoded, and is sized
+        # so a whole catch-up batch takes a single system call
+        tail_size = len(self._tail)
+        first_size = max(limit or 0, self.READ_SIZE)
+        data = bytearray(tail_size + first_size)
+        data[:tail_size] = self._tail
+        with memoryview(data) as target:
+            n = self._file.readinto(target[tail_size:]) or 0
+        del data[tail_size + n:]
+        self.position += n
+        
+        # Everything in the held file has been read - if the game has replaced the log
+        # (renamed it away and started a new one), carry on with the new file
+        if not n and self._rotated():
+            self.reopen()
+            return self.read_text(limit)
+        
+        # Without a limit, keep going until the end of the file
+        if n == first_size and not limit:
+            readinto = self._file.readinto
+            view = self._view
+            while True:
+                n = readinto(view)
+                if not n:
+                    break
+                data += view[:n]
+                self.position += n
+                if n < self.READ_SIZE:
+                    break
+                
+        # Hold back a partially written last line until the rest of it arrives
+        end = data.rfind(b'\n')
+        if end < 0:
+            self._tail = bytes(data)
+            return ''
+        self._tail = bytes(data[end + 1:])
+        with memoryview(data) as complete:
+            return str(complete[:end], 'utf-8', 'ignore')
+        
+    def close(self) -> None:
+        """Close the file handle"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
 
 class LogFileHandler(FileSystemEventHandler):
     """Custom file handler for log file changes"""
     
-    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable):
+    # Modification events arriving within this window are drained together
+    DRAIN_DELAY = 0.05
+    
+    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable,
+                 reader: Optional[LogTail] = None, abs_path: Optional[str] = None):
         self.file_path = file_path
         self.parser = parser
         self.update_callback = update_callback
-        self.last_position = 0
-        self.last_size = 0
+        self._drain_timer = None
+        self._drain_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        
+        # Target path in the forms an event can report it, so matching an event is a
+        # single set lookup (src_path is bytes when a watch is scheduled with a bytes path)
+        self._target = sys.intern(abs_path or os.path.realpath(self.file_path))
+        self._targets = frozenset((self._target, os.fsencode(self._target)))
+        # Windows paths can also differ from the target by case alone
+        self._target_norm = os.path.normcase(self._target) if os.name == 'nt' else None
         
-        # Initialize last position to end of file if it exists
-        if os.path.exists(self.file_path):
-            self.last_size = os.path.getsize(self.file_path)
-            self.last_position = self.last_size
+        # Keep one handle open, by default positioned at the end of the file
+        self.reader = reader or LogTail(self.file_path)
     
     def on_modified(self, event):
         """Handle file modification events"""
-        if event.is_directory:
-            return
+        # Check if this is our target file - directory events never match it
+        src_path = event.src_path
+        if src_path not in self._targets:
+            if self._target_norm is None or os.path.normcase(src_path) != self._target_norm:
+                return
             
-        # Check if this is our target file
-        if os.path.abspath(event.src_path) != os.path.abspath(self.file_path):
-            return
+        self._schedule_drain()
+        
+    def _schedule_drain(self):
+        """Coalesce a burst of modification events into one pass over the file"""
+        with self._drain_lock:
+            if self._drain_timer is not None:
+                return
+            self._drain_timer = threading.Timer(self.DRAIN_DELAY, self._drain)
+            self._drain_timer.daemon = True
+            self._drain_timer.start()
             
-        self._process_file_changes()
+    def _drain(self):
+        """Read everything written since the drain was scheduled"""
+        with self._drain_lock:
+            self._drain_timer = None
+        with self._process_lock:
+            self._process_file_changes()
     
     def _process_file_changes(self):
         """Process changes to the log file"""
         try:
-            if not os.path.exists(self.file_path):
-                return
-                
-            current_size = os.path.getsize(self.file_path)
-            
-            # Check if file was truncated or recreated
-            if current_size < self.last_size:
-                # File was truncated - just reset position, keep existing stats
-                self.last_position = 0
-                
-            # Read new content
-            if current_size > self.last_position:
-                with open(self.file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    f.seek(self.last_position)
-                    new_lines = f.readlines()
-                    
-                # Parse new lines
-                for line in new_lines:
-                    self.parser.parse_line(line)
-                
-                # Update position
-                self.last_position = current_size
+            # Read new content - truncation keeps existing stats and starts over
+            new_text = self.reader.read_text()
+            if new_text:
+                # Parse new lines as one block
+                self.parser.parse_chunk(new_text)
                 
                 # Notify callback
                 if self.update_callback:
                     self.update_callback()
-                    
-            self.last_size = current_size
             
         except Exception as e:
-            print(f"Error processing file changes: {e}")
+            _record_error(f"Error processing file changes: {e}")
+            
+    def close(self):
+        """Cancel any pending drain and release the log file handle"""
+        with self._drain_lock:
+            if self._drain_timer is not None:
+                self._drain_timer.cancel()
+                self._drain_timer = None
+        with self._process_lock:
+            self.reader.close()
+
+
+
 
+_observer = None
+_observer_lock = threading.Lock()
+# Number of handlers scheduled on each watch of the shared observer
+_observer_watches = {}
 
 
+def _schedule_shared(handler: FileSystemEventHandler, path: str):
+    """Schedule a handler on the observer all watchdog monitors share, starting it on first use"""
+    global _observer
+    with _observer_lock:
+        if _observer is None:
+            _observer = Observer()
+            _observer.start()
+        watch = _observer.schedule(handler, path, recursive=False)
+        _observer_watches[watch] = _observer_watches.get(watch, 0) + 1
+        return watch
+
+
+def _unschedule_shared(handler: FileSystemEventHandler, watch) -> None:
+    """Remove a handler from the shared observer, dropping the watch once nothing uses it"""
+    with _observer_lock:
+        remaining = _observer_watches.pop(watch, 1) - 1
+        if remaining:
+            # Another monitor watches the same directory (e.g. LIVE and PTU logs side by side)
+            _observer_watches[watch] = remaining
+            _observer.remove_handler_for_watch(handler, watch)
+        else:
+            _observer.unschedule(watch)
+
 
 class LogFileMonitor:
     """Enhanced log file monitor using watchdog"""
     
-    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable):
+    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable,
+                 reader: Optional[LogTail] = None):
         self.file_path = file_path
         self.parser = parser
         self.update_callback = update_callback
-        self.observer = None
+        self.reader = reader
+        self.watch = None
         self.handler = None
         self.monitoring = False
         
+        # Resolved once, the handler compares every event against the same path
+        self._abs_path = sys.intern(os.path.realpath(file_path))
+        self._watch_dir = os.path.dirname(self._abs_path)
+        
     def start_monitoring(self):
         """Start monitoring the log file"""
         if self.monitoring:
@@ -98,29 +335,28 @@ class LogFileMonitor:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Log file not found: {self.file_path}")
             
-        # Create handler (starts at end of file for future updates)
-        self.handler = LogFileHandler(self.file_path, self.parser, self.update_callback)
-        
-        # Setup observer
-        self.observer = Observer()
-        watch_dir = os.path.dirname(self.file_path)
-        self.observer.schedule(self.handler, watch_dir, recursive=False)
+        # Create handler (continues from the given reader, or the end of file for future updates)
+        self.handler = LogFileHandler(self.file_path, self.parser, self.update_callback, self.reader,
+                                      abs_path=self._abs_path)
         
-        # Start monitoring
-        self.observer.start()
+        # Watch through the shared observer, picking up anything written before the watch was in place
+        self.watch = _schedule_shared(self.handler, self._watch_dir)
         self.monitoring = True
+        self.handler._schedule_drain()
         
     def stop_monitoring(self):
         """Stop monitoring the log file"""
         if not self.monitoring:
             return
             
-        if self.observer:
-            self.observer.stop()
-            self.observer.join()
+        if self.watch:
+            _unschedule_shared(self.handler, self.watch)
+            
+        if self.handler:
+            self.handler.close()
             
         self.monitoring = False
-        self.observer = None
+        self.watch = None
         self.handler = None
         
     def is_monitoring(self) -> bool:
@@ -128,23 +364,41 @@ class LogFileMonitor:
         return self.monitoring
 
 
+_monitor_loop = None
+_monitor_loop_lock = threading.Lock()
+
+
+def _get_monitor_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop all polling monitors run on, starting its thread on first use"""
+    global _monitor_loop
+    with _monitor_loop_lock:
+        if _monitor_loop is None:
+            _monitor_loop = asyncio.new_event_loop()
+            threading.Thread(target=_monitor_loop.run_forever, name="log-monitor", daemon=True).start()
+        return _monitor_loop
+
+
 class FallbackFileMonitor:
-    """Fallback file monitor using polling (for systems where watchdog might not work)"""
+    """Fallback file monitor using polling (for systems where watchdog might not work)
+    
+    Polls quickly while the log is being written and backs off exponentially up to
+    `poll_interval` seconds while it is idle. All polling monitors share one event
+    loop thread, so watching several logs (e.g. LIVE and PTU) doesn't add threads.
+    """
+    
+    # Delay between polls right after new data was found
+    MIN_POLL_INTERVAL = 0.05
     
-    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable, poll_interval: float = 1.0):
+    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable, poll_interval: float = 2.0,
+                 reader: Optional[LogTail] = None):
         self.file_path = file_path
         self.parser = parser
         self.update_callback = update_callback
         self.poll_interval = poll_interval
         self.monitoring = False
-        self.monitor_thread = None
-        self.last_position = 0
-        self.last_size = 0
-        
-        # Initialize position
-        if os.path.exists(self.file_path):
-            self.last_size = os.path.getsize(self.file_path)
-            self.last_position = self.last_size
+        self.reader = reader
+        self._loop = None
+        self._poll_future = None
             
     def start_monitoring(self):
         """Start polling-based monitoring"""
@@ -154,76 +408,210 @@ class FallbackFileMonitor:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Log file not found: {self.file_path}")
             
+        # Keep one handle open, by default positioned at the end of the file
+        if not self.reader:
+            self.reader = LogTail(self.file_path)
+            
+        self.monitoring = True
+        self._loop = _get_monitor_loop()
+        self._poll_future = asyncio.run_coroutine_threadsafe(self._monitor_loop(), self._loop)
+        
+    def stop_monitoring(self):
+        """Stop polling-based monitoring"""
+        self.monitoring = False
+        if self._poll_future:
+            # Interrupt the current wait instead of letting it run out
+            self._poll_future.cancel()
+            self._poll_future = None
+            # Close on the loop thread, where it can't land in the middle of a read
+            if self.reader:
+                asyncio.run_coroutine_threadsafe(self._close_reader(), self._loop).result(timeout=2.0)
+        elif self.reader:
+            self.reader.close()
+            
+    def is_monitoring(self) -> bool:
+        """Check if currently monitoring"""
+        return self.monitoring
+        
+    async def _monitor_loop(self):
+        """Main monitoring loop"""
+        interval = self.MIN_POLL_INTERVAL
+        while self.monitoring:
+            try:
+                if self._check_file_changes():
+                    interval = self.MIN_POLL_INTERVAL
+                else:
+                    interval = min(interval * 2, self.poll_interval)
+                await asyncio.sleep(interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                _record_error(f"Monitor loop error: {e}")
+                break
+                
+    async def _close_reader(self):
+        """Release the log file handle"""
+        self.reader.close()
+                
+    def _check_file_changes(self) -> bool:
+        """Check for file changes - returns True if new lines were read"""
+        try:
+            # Read new content - truncation keeps existing stats and starts over
+            new_text = self.reader.read_text()
+            if new_text:
+                # Parse new lines as one block
+                self.parser.parse_chunk(new_text)
+                
+                # Notify callback
+                if self.update_callback:
+                    self.update_callback()
+                return True
+            
+        except Exception as e:
+            _record_error(f"Error checking file changes: {e}")
+        return False
+
+
+class InotifyMonitor:
+    """Linux file monitor that watches only the log file itself through inotify"""
+    
+    # Modification events arriving within this window are drained together (ms)
+    READ_DELAY_MS = 50
+    # How often the loop wakes up to check for stop requests (ms)
+    WAKEUP_MS = 500
+    
+    def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable,
+                 reader: Optional[LogTail] = None):
+        self.file_path = file_path
+        self.parser = parser
+        self.update_callback = update_callback
+        self.monitoring = False
+        self.monitor_thread = None
+        self.inotify = None
+        self.watch = None
+        self.reader = reader
+        
+    def start_monitoring(self):
+        """Start inotify-based monitoring"""
+        if self.monitoring:
+            return
+            
+        if not INOTIFY_AVAILABLE:
+            raise RuntimeError("inotify_simple is not available")
+            
+        if not os.path.exists(self.file_path):
+            raise FileNotFoundError(f"Log file not found: {self.file_path}")
+            
+        self.inotify = INotify()
+        try:
+            self._add_watch()
+        except Exception:
+            # Don't leak the inotify fd when falling back to another monitor
+            self.inotify.close()
+            self.inotify = None
+            raise
+        
+        # Keep one handle open, by default positioned at the end of the file
+        if not self.reader:
+            self.reader = LogTail(self.file_path)
+        
         self.monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         
     def stop_monitoring(self):
-        """Stop polling-based monitoring"""
+        """Stop inotify-based monitoring"""
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
+        if self.reader:
+            self.reader.close()
             
     def is_monitoring(self) -> bool:
         """Check if currently monitoring"""
         return self.monitoring
         
+    def _add_watch(self):
+        """Watch the log file for writes and for being moved or deleted"""
+        self.watch = self.inotify.add_watch(
+            self.file_path,
+            inotify_flags.MODIFY | inotify_flags.MOVE_SELF | inotify_flags.DELETE_SELF
+        )
+        
     def _monitor_loop(self):
         """Main monitoring loop"""
+        # Pick up anything written before the watch was in place
+        self._process_file_changes()
+        
         while self.monitoring:
             try:
-                self._check_file_changes()
-                time.sleep(self.poll_interval)
+                # One read returns every event queued during the delay window
+                events = self.inotify.read(timeout=self.WAKEUP_MS, read_delay=self.READ_DELAY_MS)
+                
+                changed = False
+                for event in events:
+                    if event.wd != self.watch:
+                        continue  # Left over from the watch on a log that was replaced
+                    changed = True
+                    if event.mask & inotify_flags.MOVE_SELF:
+                        # The kernel keeps watching the moved file (the game's backup of
+                        # the old log), drop that watch before following the new one
+                        try:
+                            self.inotify.rm_watch(event.wd)
+                        except OSError:
+                            pass  # Deleted as well in the meantime, the kernel dropped it
+                        self.watch = None
+                    elif event.mask & (inotify_flags.DELETE_SELF | inotify_flags.IGNORED):
+                        self.watch = None  # Already removed by the kernel
+                        
+                # The game replaced the log file - follow the new one once it exists
+                if self.watch is None:
+                    try:
+                        self._add_watch()
+                    except FileNotFoundError:
+                        continue
+                    self._process_file_changes()
+                elif changed:
+                    self._process_file_changes()
             except Exception as e:
-                print(f"Monitor loop error: {e}")
+                _record_error(f"Monitor loop error: {e}")
                 break
                 
-    def _check_file_changes(self):
-        """Check for file changes"""
+    def _process_file_changes(self):
+        """Process changes to the log file"""
         try:
-            if not os.path.exists(self.file_path):
-                return
-                
-            current_size = os.path.getsize(self.file_path)
-            
-            # Check if file was truncated
-            if current_size < self.last_size:
-                # File was truncated - just reset position, keep existing stats
-                self.last_position = 0
-                
-            # Read new content
-            if current_size > self.last_position:
-                with open(self.file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    f.seek(self.last_position)
-                    new_lines = f.readlines()
-                    
-                # Parse new lines
-                for line_num, line in enumerate(new_lines, 1):
-                    #print(f"Processing line {self.last_position // 50 + line_num}")
-                    self.parser.parse_line(line)
-                    
-                # Update position
-                self.last_position = current_size
+            # Read new content - truncation keeps existing stats and starts over
+            new_text = self.reader.read_text()
+            if new_text:
+                # Parse new lines as one block
+                self.parser.parse_chunk(new_text)
                 
                 # Notify callback
                 if self.update_callback:
                     self.update_callback()
-                    
-            self.last_size = current_size
             
         except Exception as e:
-            print(f"Error checking file changes: {e}")
+            _record_error(f"Error processing file changes: {e}")
 
 
 class SmartFileMonitor:
-    """Smart file monitor that tries watchdog first, falls back to polling"""
+    """Smart file monitor that tries inotify (Linux) and watchdog first, falls back to polling"""
+    
+    # Bytes parsed per batch while catching up with the existing log contents
+    CATCH_UP_SIZE = 1 << 20
     
     def __init__(self, file_path: str, parser: SCLogParser, update_callback: Callable):
         self.file_path = file_path
         self.parser = parser
         self.update_callback = update_callback
         self.current_monitor = None
+        self.reader = None
+        self.use_inotify = INOTIFY_AVAILABLE
         self.use_watchdog = True
+        self.use_state_cache = True
         
     def start_monitoring(self):
         """Start monitoring with best available method"""
@@ -236,15 +624,35 @@ class SmartFileMonitor:
         # Reset stats before initial parse in case there was already data
         self.parser.reset_stats()
         
-        # Do initial full read of the file before starting monitoring
-        self.parser.parse_file(self.file_path, start_from_end=False)
+        # Read the existing file contents before starting monitoring, resuming from
+        # the state saved by a previous run when the log still starts the same way
+        position = 0
+        if self.use_state_cache:
+            cached = _load_cached_state(self.file_path)
+            if cached and self.parser.restore_state(cached['state']):
+                position = cached['position']
+                print(f"Resuming log parsing at byte {position}")
+                
+        self.reader = LogTail(self.file_path, position=position)
+        self._catch_up()
         if self.update_callback:
             self.update_callback()
         
-        # Try watchdog first
+        # Watch the file directly through inotify where available
+        if self.use_inotify:
+            try:
+                self.current_monitor = InotifyMonitor(self.file_path, self.parser, self.update_callback, reader=self.reader)
+                self.current_monitor.start_monitoring()
+                print("Started inotify-based monitoring")
+                return
+            except Exception as e:
+                print(f"Inotify monitoring failed: {e}, falling back to watchdog")
+                self.use_inotify = False
+                
+        # Then watchdog
         if self.use_watchdog:
             try:
-                self.current_monitor = LogFileMonitor(self.file_path, self.parser, self.update_callback)
+                self.current_monitor = LogFileMonitor(self.file_path, self.parser, self.update_callback, reader=self.reader)
                 self.current_monitor.start_monitoring()
                 print("Started watchdog-based monitoring")
                 return
@@ -254,22 +662,96 @@ class SmartFileMonitor:
                 
         # Fallback to polling
         try:
-            self.current_monitor = FallbackFileMonitor(self.file_path, self.parser, self.update_callback)
+            self.current_monitor = FallbackFileMonitor(self.file_path, self.parser, self.update_callback, reader=self.reader)
             self.current_monitor.start_monitoring()
             print("Started polling-based monitoring")
         except Exception as e:
             print(f"All monitoring methods failed: {e}")
+            self.reader.close()
             raise
             
     def stop_monitoring(self):
-        """Stop monitoring"""
+        """Stop monitoring and remember how far the log was parsed"""
         if self.current_monitor:
             self.current_monitor.stop_monitoring()
             self.current_monitor = None
             
+            if self.use_state_cache:
+                _save_cached_state(self.file_path, self.reader.parsed_position, self.parser.export_state())
+            
     def is_monitoring(self) -> bool:
         """Check if currently monitoring"""
         return self.current_monitor and self.current_monitor.is_monitoring()
+        
+    def _catch_up(self):
+        """Parse the rest of the file in bounded batches"""
+        while True:
+            position = self.reader.position
+            self.parser.parse_chunk(self.reader.read_text(limit=self.CATCH_UP_SIZE))
+            if self.reader.position == position:
+                break
+
+
+def _file_fingerprint(file_path: str, position: int) -> bytes:
+    """Get the bytes at the start of the file and just before a position in it"""
+    start = max(0, position - FINGERPRINT_SIZE)
+    with open(file_path, 'rb') as f:
+        head = f.read(min(position, FINGERPRINT_SIZE))
+        f.seek(start)
+        return head + f.read(position - start)
+
+
+def _read_state_cache() -> dict:
+    """Load all cached parser states, keyed by log file path"""
+    try:
+        with open(STATE_CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Ignoring unreadable state cache: {e}")
+        return {}
+
+
+def _load_cached_state(file_path: str) -> Optional[dict]:
+    """Get the cached parser state for a log file if the file still matches it"""
+    entry = _read_state_cache().get(os.path.abspath(file_path))
+    if not entry:
+        return None
+        
+    try:
+        st = os.stat(file_path)
+        if (st.st_dev, st.st_ino) != (entry['dev'], entry['ino']) or st.st_size < entry['position']:
+            return None
+        if _file_fingerprint(file_path, entry['position']) != entry['fingerprint']:
+            return None
+    except (OSError, KeyError):
+        return None
+        
+    return entry
+
+
+def _save_cached_state(file_path: str, position: int, state: dict) -> None:
+    """Cache the parser state for a log file parsed up to a position"""
+    try:
+        st = os.stat(file_path)
+        cache = _read_state_cache()
+        cache[os.path.abspath(file_path)] = {
+            'dev': st.st_dev,
+            'ino': st.st_ino,
+            'position': position,
+            'fingerprint': _file_fingerprint(file_path, position),
+            'state': state,
+        }
+        
+        os.makedirs(STATE_CACHE_DIR, exist_ok=True)
+        temp_file = STATE_CACHE_FILE + '.tmp'
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, STATE_CACHE_FILE)
+    except Exception as e:
+        print(f"Failed to save state cache: {e}")
 
 
 # For backward compatibility
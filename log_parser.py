@@ -7,13 +7,87 @@ and session information from Star Citizen Game.log files.
 """
 
 import re
+import sys
 import json
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import mmap
+import threading
+from array import array
+from collections import deque
+from itertools import islice
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+from functools import partial
 
 
-@dataclass
+# Log types (the <Type> after the timestamp) that carry gameplay events
+EVENT_LOG_TYPES = (
+    "CEntityComponentShopUIProvider::SendShopBuyRequest",
+    "CEntityComponentShopUIProvider::SendShopSellRequest",
+    "CEntityComponentShoppingProvider::SendStandardItemBuyRequest",
+    "CEntityComponentShoppingProvider::SendStandardItemSellRequest",
+    "Channel Created",
+    "Channel Disconnected",
+    "CEntityComponentCommodityUIProvider::SendCommoditySellRequest",
+    "CEntityComponentCommodityUIProvider::SendCommodityBuyRequest",
+    "EndMission",
+)
+
+# datetime.fromisoformat() takes the trailing Z of Game.log timestamps as UTC itself
+# from Python 3.11 on, older versions need it spelled as +00:00
+FROMISOFORMAT_READS_Z = sys.version_info >= (3, 11)
+
+# Read buffer for parsing whole log files
+FILE_BUFFER_SIZE = 1 << 20
+
+# Version of the parser state returned by SCLogParser.export_state()
+# Bump whenever the layout of the stats dataclasses below changes
+STATE_VERSION = 6
+
+# Codes for InventoryInfo.kinds, by TransactionItem.transaction_type (0 for anything else)
+TRANSACTION_PURCHASE = 1
+TRANSACTION_SALE = 2
+TRANSACTION_KINDS = {"purchase": TRANSACTION_PURCHASE, "sale": TRANSACTION_SALE}
+
+# GameStats sections available through SCLogParser.get_stats_view()
+STATS_SECTIONS = ('session', 'inventory', 'missions')
+
+# Width of the item name and location columns in the GUI's recent transactions table
+DISPLAY_NAME_WIDTH = 34
+
+# Transaction and mission records kept for display, older ones only remain in the totals
+RECENT_RECORDS = 1000
+
+# MissionStats counter for each (lower-case) mission completion type
+MISSION_COUNTERS = {'complete': 'missions_completed', 'abandon': 'missions_abandoned'}
+
+# Stats records are created for every event of a session, give them fixed attribute
+# slots instead of a __dict__ where dataclasses support it (Python 3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _extract_fields(line: str, keys: tuple) -> Optional[List[str]]:
+    """Get the values of `key[value]` fields appearing in the given order in a line
+    
+    Returns None unless every key is found with a non-empty value. Plain str.find()
+    calls on the literal keys, rather than a regex with lazy gaps between them.
+    """
+    values = []
+    pos = 0
+    for key in keys:
+        start = line.find(key, pos)
+        if start < 0:
+            return None
+        start += len(key)
+        end = line.find(']', start)
+        if end <= start:
+            return None
+        values.append(line[start:end])
+        pos = end + 1
+    return values
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class SessionInfo:
     """Information about the current game session"""
     player_name: str = ""
@@ -24,9 +98,22 @@ class SessionInfo:
     game_version: str = ""
     map_name: str = ""
     uptime_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the session info as a JSON-ready dictionary"""
+        return {
+            'player_name': self.player_name,
+            'player_geid': self.player_geid,
+            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'branch': self.branch,
+            'game_version': self.game_version,
+            'map_name': self.map_name,
+            'uptime_seconds': self.uptime_seconds,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TransactionItem:
     """Individual item transaction record"""
     item_name: str = ""
@@ -35,9 +122,30 @@ class TransactionItem:
     quantity: int = 1
     timestamp: Optional[datetime] = None
     location: str = ""
+    # HH:MM:SS of the timestamp, item name and location cut to DISPLAY_NAME_WIDTH for
+    # display, all prepared once when the record is created
+    time_str: str = field(init=False, default="", repr=False, compare=False)
+    display_item: str = field(init=False, default="", repr=False, compare=False)
+    display_location: str = field(init=False, default="", repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.time_str = self.timestamp.strftime('%H:%M:%S') if self.timestamp else 'Unknown'
+        self.display_item = self.item_name[:DISPLAY_NAME_WIDTH]
+        self.display_location = self.location[:DISPLAY_NAME_WIDTH]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the transaction as a JSON-ready dictionary"""
+        return {
+            'item_name': self.item_name,
+            'transaction_type': self.transaction_type,
+            'price': self.price,
+            'quantity': self.quantity,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'location': self.location,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MissionRecord:
     """Individual mission completion/failure record"""
     mission_id: str = ""
@@ -46,37 +154,99 @@ class MissionRecord:
     completion_type: str = ""  # "Complete", "Abandon", "Fail"
     reason: str = ""
     timestamp: Optional[datetime] = None
+    # HH:MM:SS of the timestamp and the shortened mission ID for display, prepared once
+    # when the record is created
+    time_str: str = field(init=False, default="", repr=False, compare=False)
+    display_id: str = field(init=False, default="", repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.time_str = self.timestamp.strftime('%H:%M:%S') if self.timestamp else 'Unknown'
+        self.display_id = self.mission_id[:8] + "..." if len(self.mission_id) > 8 else self.mission_id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the mission record as a JSON-ready dictionary"""
+        return {
+            'mission_id': self.mission_id,
+            'player_name': self.player_name,
+            'player_id': self.player_id,
+            'completion_type': self.completion_type,
+            'reason': self.reason,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MissionInfo:
     """Mission tracking information"""
-    missions: List[MissionRecord] = None
+    missions: Deque[MissionRecord] = None  # The last RECENT_RECORDS missions
     missions_completed: int = 0
     missions_abandoned: int = 0
     missions_failed: int = 0
     
     def __post_init__(self):
         if self.missions is None:
-            self.missions = []
+            self.missions = deque(maxlen=RECENT_RECORDS)
+    
+    @property
+    def total_missions(self) -> int:
+        """Number of missions ended in the session"""
+        return self.missions_completed + self.missions_abandoned + self.missions_failed
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Mission stats as a JSON-serializable dictionary"""
+        return {
+            'missions': [mission.to_dict() for mission in self.missions],
+            'missions_completed': self.missions_completed,
+            'missions_abandoned': self.missions_abandoned,
+            'missions_failed': self.missions_failed,
+            'total_missions': self.total_missions,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class InventoryInfo:
     """Inventory and transaction tracking (placeholder for future implementation)"""
-    transactions: List[TransactionItem] = None
+    transactions: Deque[TransactionItem] = None  # The last RECENT_RECORDS transactions
     total_money_earned: float = 0.0
     total_money_spent: float = 0.0
     net_profit: float = 0.0
     total_items_purchased: int = 0
     total_items_sold: int = 0
+    total_transactions: int = 0
+    # Total cost, quantity and kind (TRANSACTION_KINDS) of the transactions not yet in
+    # the totals, kept in compact columns - they are emptied once folded into the totals
+    costs: array = None
+    quantities: array = None
+    kinds: array = None
     
     def __post_init__(self):
         if self.transactions is None:
-            self.transactions = []
+            self.transactions = deque(maxlen=RECENT_RECORDS)
+        if self.costs is None:
+            self.costs = array('d')
+        if self.quantities is None:
+            self.quantities = array('q')
+        if self.kinds is None:
+            self.kinds = array('b')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Inventory stats as a JSON-serializable dictionary
+        
+        The transaction columns are left out, they are empty once the totals are up
+        to date and the records carry the same data.
+        """
+        return {
+            'transactions': [transaction.to_dict() for transaction in self.transactions],
+            'total_money_earned': self.total_money_earned,
+            'total_money_spent': self.total_money_spent,
+            'net_profit': self.net_profit,
+            'total_items_purchased': self.total_items_purchased,
+            'total_items_sold': self.total_items_sold,
+            'total_transactions': self.total_transactions,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GameStats:
     """Complete game statistics container"""
     session: SessionInfo
@@ -89,16 +259,37 @@ class SCLogParser:
     """V3SCInfo - Star Citizen Game.log parser by V3h3m3ntis"""
     
     def __init__(self):
-        self.stats = GameStats(
+        self._stats = GameStats(
             session=SessionInfo(),
             inventory=InventoryInfo(),
             missions=MissionInfo()
         )
+        # Completion types of the missions not yet in the totals, these are only
+        # brought up to date when the stats are read
+        self._pending_completion_types: List[str] = []
+        self._totals_pending = False
+        # Set once branch and game version are both known, their patterns are skipped from then on
+        self._session_info_complete = False
         self.patterns = self._compile_patterns()
+        self._dispatch = self._build_dispatch()
+        # Last timestamp string parsed and its result, see _parse_timestamp()
+        self._last_timestamp = (None, None)
+        
+        # Held for each parsed batch, so monitor threads and readers never see half an update
+        self.lock = threading.RLock()
+        # Bumped for every parsed batch and reset, readers can keep what they derive from
+        # the stats until it changes. Waiters on the condition are notified of each bump.
+        self.revision = 0
+        self.updated = threading.Condition(self.lock)
         
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
         """Compile regex patterns for log parsing"""
+        event_alternation = '|'.join(re.escape(log_type) for log_type in EVENT_LOG_TYPES)
         return {
+            # Block scanners finding the lines worth a closer look (see parse_chunk)
+            'event_scan': re.compile(r'<(?:' + event_alternation + r')>'),
+            'event_or_session_scan': re.compile(r'<(?:' + event_alternation + r')>|Branch:|ProductVersion:'),
+            
             # Basic parsing patterns
             'timestamp': re.compile(r'<([0-9T:.-]+Z?)>'),
             'log_level': re.compile(r'\[([^\]]+)\]'),
@@ -111,15 +302,7 @@ class SCLogParser:
             
             'uptime': re.compile(r'uptime_secs=([\d.]+)'),
             
-            # Transaction-specific patterns (only applied when log_type matches)
-            'shop_buy_transaction': re.compile(r'shopName\[([^\]]+)\].*?client_price\[([\d.]+)\].*?itemName\[([^\]]+)\].*?quantity\[([\d]+)\]'),
-            'shop_sell_transaction': re.compile(r'shopName\[([^\]]+)\].*?client_price\[([\d.]+)\].*?itemName\[([^\]]+)\].*?quantity\[([\d]+)\]'),
-            'standard_buy_transaction': re.compile(r'shopName\[([^\]]+)\].*?client_price\[([\d.]+)\].*?itemName\[([^\]]+)\].*?quantity\[([\d]+)\]'),
-            'standard_sell_transaction': re.compile(r'shopName\[([^\]]+)\].*?client_price\[([\d.]+)\].*?itemName\[([^\]]+)\].*?quantity\[([\d]+)\]'),
-            
-            # Commodity trading patterns
-            'commodity_sell_transaction': re.compile(r'shopName\[([^\]]+)\].*?amount\[([\d.]+)\].*?resourceGUID\[([^\]]+)\].*?quantity\[([\d]+)\]'),
-            'commodity_buy_transaction': re.compile(r'shopName\[([^\]]+)\].*?price\[([\d.]+)\].*?resourceGUID\[([^\]]+)\].*?quantity\[([\d.]+) cSCU\]'),
+            # Transaction fields are read with _extract_fields() instead of patterns
             
             # Channel Created specific patterns (extract multiple pieces of info)
             'channel_created': re.compile(r'map="([^"]*)".*?nickname="([^"]*)".*?playerGEID=(\d+)'),
@@ -129,176 +312,266 @@ class SCLogParser:
             'mission_end': re.compile(r'MissionId\[([^\]]+)\]\s+Player\[([^\]]+)\]\s+PlayerId\[([^\]]+)\]\s+CompletionType\[([^\]]+)\]\s+Reason\[([^\]]+)\]'),
         }
     
+    @property
+    def stats(self) -> GameStats:
+        """Current statistics, with the inventory and mission totals up to date"""
+        if self._totals_pending:
+            with self.lock:
+                self._update_totals()
+        return self._stats
+        
+    def _build_dispatch(self) -> Dict[str, Callable[[str], None]]:
+        """Map each event log type to the bound method handling its lines"""
+        return {
+            "CEntityComponentShopUIProvider::SendShopBuyRequest": partial(self._handle_shop_transaction, transaction_type="purchase"),
+            "CEntityComponentShopUIProvider::SendShopSellRequest": partial(self._handle_shop_transaction, transaction_type="sale"),
+            "CEntityComponentShoppingProvider::SendStandardItemBuyRequest": partial(self._handle_shop_transaction, transaction_type="purchase"),
+            "CEntityComponentShoppingProvider::SendStandardItemSellRequest": partial(self._handle_shop_transaction, transaction_type="sale"),
+            "Channel Created": self._handle_channel_created,
+            "Channel Disconnected": self._handle_channel_disconnected,
+            "CEntityComponentCommodityUIProvider::SendCommoditySellRequest": self._handle_commodity_sell_request,
+            "CEntityComponentCommodityUIProvider::SendCommodityBuyRequest": self._handle_commodity_buy_request,
+            "EndMission": self._handle_end_mission,
+            # Add more log type handlers here as needed (and to EVENT_LOG_TYPES)
+        }
+    
     def parse_line(self, line: str) -> bool:
-        """Parse a single log line and update stats - optimized approach"""
-        if not line.strip():
-            return False
-            
-        # Extract timestamp and log type together (most efficient)
-        log_type_match = self.patterns['log_type'].search(line)
-        if log_type_match:
-            # Extract timestamp from the same match
-            try:
-                timestamp_str = log_type_match.group(1)
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                self.stats.last_update = timestamp
+        """Parse a single log line and update stats"""
+        return self.parse_lines((line,)) > 0
+    
+    def parse_lines(self, lines: Iterable[str]) -> int:
+        """Parse a batch of log lines and update stats - returns the number of lines used"""
+        with self.lock:
+            self.revision += 1
+            self.updated.notify_all()
+            return self._parse_lines(lines)
+    
+    def _parse_lines(self, lines: Iterable[str]) -> int:
+        """Per-line state machine behind parse_lines(), the caller holds the lock
+        
+        It runs inline here so bursts of log writes don't pay for a method call and
+        attribute lookups on every line. Once the session start is known, one combined
+        search rejects lines that can't carry an event or session info. Those only
+        move the last update time, so only the latest of them is looked at, right
+        before the next line that is used and at the end of the batch.
+        
+        This stays plain Python on purpose. What is left per line is str.find(),
+        slicing and a few regex calls that already run in C, and the PyInstaller
+        build has no compiler step for an extension module.
+        """
+        session = self._stats.session
+        session_info_complete = self._session_info_complete
+        if session_info_complete:
+            prefilter = self.patterns['event_scan'].search
+        else:
+            prefilter = self.patterns['event_or_session_scan'].search
+        started = session.start_time is not None
+        skipped = None
+        
+        log_type_search = self.patterns['log_type'].search
+        timestamp_search = self.patterns['timestamp'].search
+        branch_search = self.patterns['branch'].search
+        game_version_search = self.patterns['game_version'].search
+        parse_timestamp = self._parse_timestamp
+        dispatch_get = self._dispatch.get
+        handled = 0
+        
+        for line in lines:
+            if not line or line.isspace():
+                continue
                 
-                # Set session start time if not set
-                if not self.stats.session.start_time:
-                    self.stats.session.start_time = timestamp
-                    
-            except ValueError:
-                pass  # Invalid timestamp format
-            
-            log_type = log_type_match.group(2)
+            if started and not prefilter(line):
+                skipped = line
+                continue
+            if skipped is not None:
+                self._update_last_timestamp(skipped)
+                skipped = None
+                
+            # Timestamps and log types are both in <...>, lines without any skip the regexes
+            has_brackets = '<' in line
             
-            # Use switch-case like logic to handle specific log types
-            if log_type == "CEntityComponentShopUIProvider::SendShopBuyRequest":
-                self._handle_shop_ui_buy_request(line)
-                return True
-            elif log_type == "CEntityComponentShopUIProvider::SendShopSellRequest":
-                self._handle_shop_ui_sell_request(line)
-                return True
-            elif log_type == "CEntityComponentShoppingProvider::SendStandardItemBuyRequest":
-                self._handle_shopping_provider_buy_request(line)
-                return True
-            elif log_type == "CEntityComponentShoppingProvider::SendStandardItemSellRequest":
-                self._handle_shopping_provider_sell_request(line)
-                return True
-            elif log_type == "Channel Created":
-                self._handle_channel_created(line)
-                return True
-            elif log_type == "Channel Disconnected":
-                self._handle_channel_disconnected(line)
-                return True
-            elif log_type == "CEntityComponentCommodityUIProvider::SendCommoditySellRequest":
-                self._handle_commodity_sell_request(line)
-                return True
-            elif log_type == "CEntityComponentCommodityUIProvider::SendCommodityBuyRequest":
-                self._handle_commodity_buy_request(line)
-                return True
-            elif log_type == "EndMission":
-                self._handle_end_mission(line)
-                return True
-            # Add more log type handlers here as needed
-        else:
-            # Extract timestamp separately for lines without log types
-            timestamp_match = self.patterns['timestamp'].search(line)
-            if timestamp_match:
-                try:
-                    timestamp_str = timestamp_match.group(1)
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    self.stats.last_update = timestamp
+            # Extract timestamp and log type together (most efficient). Event lines start
+            # with "<timestamp> [level] <type>", so both are sliced out at the brackets
+            # found by str.find(), the pattern is only needed for any other layout.
+            log_type = None
+            if line[0] == '<':
+                end = line.find('>')
+                start = line.find('<', end) if end > 1 else -1
+                type_end = line.find('>', start) if start > 0 else -1
+                if type_end > start + 1:
+                    timestamp_str = line[1:end]
+                    log_type = line[start + 1:type_end]
+            elif has_brackets:
+                log_type_match = log_type_search(line)
+                if log_type_match:
+                    timestamp_str, log_type = log_type_match.groups()
+            if log_type:
+                # Extract timestamp from the same span (None for an invalid format)
+                timestamp = parse_timestamp(timestamp_str)
+                if timestamp:
+                    self._stats.last_update = timestamp
                     
                     # Set session start time if not set
-                    if not self.stats.session.start_time:
-                        self.stats.session.start_time = timestamp
-                        
-                except ValueError:
-                    pass  # Invalid timestamp format
-        
-        # Handle non-bracketed patterns (one-time session info)
-        # These are typically initialization data that don't have the <Type> format
-        
-        # Parse branch (only if not already set)
-        if not self.stats.session.branch:
-            branch_match = self.patterns['branch'].search(line)
-            if branch_match:
-                self.stats.session.branch = branch_match.group(1)
-                return True
+                    if not self._stats.session.start_time:
+                        self._stats.session.start_time = timestamp
+                
+                # Hand the line to the handler registered for its log type
+                handler = dispatch_get(log_type)
+                if handler:
+                    handler(line)
+                    handled += 1
+                    continue
+            elif has_brackets:
+                # Extract timestamp separately for lines without log types
+                timestamp_match = timestamp_search(line)
+                timestamp = timestamp_match and parse_timestamp(timestamp_match.group(1))
+                if timestamp:
+                    self._stats.last_update = timestamp
+                    
+                    # Set session start time if not set
+                    if not self._stats.session.start_time:
+                        self._stats.session.start_time = timestamp
             
-        # Parse game version (only if not already set)
-        if not self.stats.session.game_version:
-            version_match = self.patterns['game_version'].search(line)
-            if version_match:
-                self.stats.session.game_version = version_match.group(1)
-                return True
+            # Handle non-bracketed patterns (one-time session info)
+            # These are typically initialization data that don't have the <Type> format
+            if not session_info_complete:
+                # Parse branch (only if not already set)
+                if not session.branch:
+                    branch_match = branch_search(line)
+                    if branch_match:
+                        session.branch = branch_match.group(1)
+                        handled += 1
+                        session_info_complete = self._session_info_complete = bool(session.game_version)
+                        continue
+                    
+                # Parse game version (only if not already set)
+                if not session.game_version:
+                    version_match = game_version_search(line)
+                    if version_match:
+                        session.game_version = version_match.group(1)
+                        handled += 1
+                        session_info_complete = self._session_info_complete = bool(session.branch)
+                    
+            started = self._stats.session.start_time is not None
         
-        return False
+        if skipped is not None:
+            self._update_last_timestamp(skipped)
+        return handled
     
-    def _handle_shop_ui_buy_request(self, line: str) -> None:
-        """Handle CEntityComponentShopUIProvider::SendShopBuyRequest log entries"""
-        match = self.patterns['shop_buy_transaction'].search(line)
+    def _update_last_timestamp(self, line: str) -> None:
+        """Take the last update time from a line that is otherwise not used"""
+        match = self.patterns['timestamp'].search(line)
         if match:
-            shop_name = match.group(1)
-            total_price = float(match.group(2))
-            item_name = match.group(3)
-            quantity = int(match.group(4))
-            
-            individual_price = total_price / quantity if quantity > 0 else total_price
-            
-            transaction = TransactionItem(
-                item_name=item_name,
-                transaction_type="purchase",
-                price=individual_price,
-                quantity=quantity,
-                timestamp=self.stats.last_update,
-                location=shop_name
-            )
-            
-            self._add_transaction(transaction)
+            timestamp = self._parse_timestamp(match.group(1))
+            if timestamp:
+                self._stats.last_update = timestamp
     
-    def _handle_shop_ui_sell_request(self, line: str) -> None:
-        """Handle CEntityComponentShopUIProvider::SendShopSellRequest log entries"""
-        match = self.patterns['shop_sell_transaction'].search(line)
-        if match:
-            shop_name = match.group(1)
-            total_price = float(match.group(2))
-            item_name = match.group(3)
-            quantity = int(match.group(4))
-            
-            individual_price = total_price / quantity if quantity > 0 else total_price
-            
-            transaction = TransactionItem(
-                item_name=item_name,
-                transaction_type="sale",
-                price=individual_price,
-                quantity=quantity,
-                timestamp=self.stats.last_update,
-                location=shop_name
-            )
-            
-            self._add_transaction(transaction)
+    def parse_chunk(self, text: str) -> int:
+        """Parse a block of complete log lines and update stats - returns the number of lines used
+        
+        One regex scan over the whole block finds the lines that can carry events or
+        session info, and only those go through the per-line state machine. Every other
+        line would only move the timestamps, which are taken from the first and last
+        timestamped lines of the block instead.
+        """
+        with self.lock:
+            self.revision += 1
+            self.updated.notify_all()
+            return self._parse_chunk(text)
     
-    def _handle_shopping_provider_buy_request(self, line: str) -> None:
-        """Handle CEntityComponentShoppingProvider::SendStandardItemBuyRequest log entries"""
-        match = self.patterns['standard_buy_transaction'].search(line)
-        if match:
-            shop_name = match.group(1)
-            total_price = float(match.group(2))
-            item_name = match.group(3)
-            quantity = int(match.group(4))
+    def _parse_chunk(self, text: str) -> int:
+        """Block scan behind parse_chunk(), the caller holds the lock"""
+        session = self._stats.session
+        if self._session_info_complete:
+            scanner = self.patterns['event_scan']
+        else:
+            scanner = self.patterns['event_or_session_scan']
             
-            individual_price = total_price / quantity if quantity > 0 else total_price
+        # The first timestamp of the session marks its start
+        if not session.start_time:
+            for match in self.patterns['timestamp'].finditer(text):
+                timestamp = self._parse_timestamp(match.group(1))
+                if timestamp:
+                    session.start_time = timestamp
+                    break
+                    
+        # Cut the interesting lines out of the block, in order and once each
+        lines = []
+        line_end = -1
+        for match in scanner.finditer(text):
+            if match.start() <= line_end:
+                continue
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end < 0:
+                line_end = len(text)
+            lines.append(text[line_start:line_end])
             
-            transaction = TransactionItem(
-                item_name=item_name,
-                transaction_type="purchase",
-                price=individual_price,
-                quantity=quantity,
-                timestamp=self.stats.last_update,
-                location=shop_name
-            )
+        handled = self._parse_lines(lines)
+        
+        # The last timestamped line of the block is the latest update
+        last_update = self._find_last_timestamp(text)
+        if last_update:
+            self._stats.last_update = last_update
             
-            self._add_transaction(transaction)
+        return handled
     
-    def _handle_shopping_provider_sell_request(self, line: str) -> None:
-        """Handle CEntityComponentShoppingProvider::SendStandardItemSellRequest log entries"""
-        match = self.patterns['standard_sell_transaction'].search(line)
-        if match:
-            shop_name = match.group(1)
-            total_price = float(match.group(2))
-            item_name = match.group(3)
-            quantity = int(match.group(4))
+    def _find_last_timestamp(self, text: str) -> Optional[datetime]:
+        """Get the timestamp of the last timestamped line in a block"""
+        end = len(text)
+        while end > 0:
+            start = text.rfind('\n', 0, end) + 1
+            line = text[start:end]
+            match = self.patterns['log_type'].search(line) or self.patterns['timestamp'].search(line)
+            if match:
+                timestamp = self._parse_timestamp(match.group(1))
+                if timestamp:
+                    return timestamp
+            end = start - 1
+        return None
+    
+    def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
+        """Parse a log timestamp, returns None for invalid ones
+        
+        Bursts of log lines are often written within the same millisecond, so the last
+        parsed timestamp is kept and reused while the string repeats.
+        """
+        last_str, last_timestamp = self._last_timestamp
+        if timestamp_str == last_str:
+            return last_timestamp
+        try:
+            if FROMISOFORMAT_READS_Z:
+                timestamp = datetime.fromisoformat(timestamp_str)
+            else:
+                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            timestamp = None
+        self._last_timestamp = (timestamp_str, timestamp)
+        return timestamp
+    
+    def _handle_shop_transaction(self, line: str, transaction_type: str) -> None:
+        """Handle shop UI and standard item buy/sell request log entries
+        
+        Covers CEntityComponentShopUIProvider::SendShop{Buy,Sell}Request and
+        CEntityComponentShoppingProvider::SendStandardItem{Buy,Sell}Request.
+        """
+        fields = _extract_fields(line, ('shopName[', 'client_price[', 'itemName[', 'quantity['))
+        if fields:
+            shop_name, price_str, item_name, quantity_str = fields
+            try:
+                total_price = float(price_str)
+                quantity = int(quantity_str)
+            except ValueError:
+                return  # Malformed numbers, not a usable transaction
             
             individual_price = total_price / quantity if quantity > 0 else total_price
             
             transaction = TransactionItem(
                 item_name=item_name,
-                transaction_type="sale",
+                transaction_type=transaction_type,
                 price=individual_price,
                 quantity=quantity,
-                timestamp=self.stats.last_update,
+                timestamp=self._stats.last_update,
                 location=shop_name
             )
             
@@ -306,12 +579,14 @@ class SCLogParser:
     
     def _handle_commodity_sell_request(self, line: str) -> None:
         """Handle CEntityComponentCommodityUIProvider::SendCommoditySellRequest log entries"""
-        match = self.patterns['commodity_sell_transaction'].search(line)
-        if match:
-            shop_name = match.group(1)
-            total_amount = float(match.group(2))  # Total aUEC received
-            resource_guid = match.group(3)  # Using GUID as item identifier
-            quantity = int(match.group(4))  # Number of items sold
+        fields = _extract_fields(line, ('shopName[', 'amount[', 'resourceGUID[', 'quantity['))
+        if fields:
+            shop_name, amount_str, resource_guid, quantity_str = fields  # GUID is used as item identifier
+            try:
+                total_amount = float(amount_str)  # Total aUEC received
+                quantity = int(quantity_str)  # Number of items sold
+            except ValueError:
+                return  # Malformed numbers, not a usable transaction
             
             individual_price = total_amount / quantity if quantity > 0 else total_amount
             
@@ -320,7 +595,7 @@ class SCLogParser:
                 transaction_type="sale",
                 price=individual_price,
                 quantity=quantity,
-                timestamp=self.stats.last_update,
+                timestamp=self._stats.last_update,
                 location=shop_name
             )
             
@@ -328,12 +603,14 @@ class SCLogParser:
     
     def _handle_commodity_buy_request(self, line: str) -> None:
         """Handle CEntityComponentCommodityUIProvider::SendCommodityBuyRequest log entries"""
-        match = self.patterns['commodity_buy_transaction'].search(line)
-        if match:
-            shop_name = match.group(1)
-            total_price = float(match.group(2))  # Total aUEC spent
-            resource_guid = match.group(3)  # Using GUID as item identifier
-            quantity_cscu = float(match.group(4))  # Quantity in cSCU
+        fields = _extract_fields(line, ('shopName[', 'price[', 'resourceGUID[', 'quantity['))
+        if fields and fields[3].endswith(' cSCU'):
+            shop_name, price_str, resource_guid, quantity_str = fields  # GUID is used as item identifier
+            try:
+                total_price = float(price_str)  # Total aUEC spent
+                quantity_cscu = float(quantity_str[:-5])  # Quantity in cSCU
+            except ValueError:
+                return  # Malformed numbers, not a usable transaction
             
             # Convert cSCU to actual quantity (divide by 100)
             actual_quantity = int(quantity_cscu / 100) if quantity_cscu >= 100 else 1
@@ -344,7 +621,7 @@ class SCLogParser:
                 transaction_type="purchase",
                 price=individual_price,
                 quantity=actual_quantity,
-                timestamp=self.stats.last_update,
+                timestamp=self._stats.last_update,
                 location=shop_name
             )
             
@@ -355,19 +632,19 @@ class SCLogParser:
         # Try to extract all info at once (map, nickname, playerGEID)
         full_match = self.patterns['channel_created'].search(line)
         if full_match:
-            self.stats.session.map_name = full_match.group(1)
-            self.stats.session.player_name = full_match.group(2)
-            self.stats.session.player_geid = full_match.group(3)
+            self._stats.session.map_name = full_match.group(1)
+            self._stats.session.player_name = full_match.group(2)
+            self._stats.session.player_geid = full_match.group(3)
     
     def _handle_channel_disconnected(self, line: str) -> None:
         """Handle Channel Disconnected log entries for session end and final uptime"""
-        if self.stats.last_update:
-            self.stats.session.end_time = self.stats.last_update
+        if self._stats.last_update:
+            self._stats.session.end_time = self._stats.last_update
         
         # Extract final uptime if available
         uptime_match = self.patterns['channel_disconnected'].search(line)
         if uptime_match:
-            self.stats.session.uptime_seconds = float(uptime_match.group(1))
+            self._stats.session.uptime_seconds = float(uptime_match.group(1))
     
     def _handle_end_mission(self, line: str) -> None:
         """Handle EndMission log entries for mission completion tracking"""
@@ -376,7 +653,7 @@ class SCLogParser:
             mission_id = match.group(1)
             player_name = match.group(2)
             player_id = match.group(3)
-            completion_type = match.group(4)
+            completion_type = sys.intern(match.group(4))
             reason = match.group(5)
             
             mission = MissionRecord(
@@ -385,126 +662,207 @@ class SCLogParser:
                 player_id=player_id,
                 completion_type=completion_type,
                 reason=reason,
-                timestamp=self.stats.last_update
+                timestamp=self._stats.last_update
             )
             
             self._add_mission(mission)
     
     def _add_transaction(self, transaction: TransactionItem) -> None:
-        """Add a transaction and update inventory statistics"""
-        self.stats.inventory.transactions.append(transaction)
-        
-        total_cost = transaction.price * transaction.quantity
+        """Add a transaction, inventory statistics are updated when next read"""
+        inventory = self._stats.inventory
+        inventory.transactions.append(transaction)
+        inventory.costs.append(transaction.price * transaction.quantity)
+        inventory.quantities.append(transaction.quantity)
+        inventory.kinds.append(TRANSACTION_KINDS.get(transaction.transaction_type, 0))
+        self._totals_pending = True
+    
+    def _add_mission(self, mission: MissionRecord) -> None:
+        """Add a mission, mission statistics are updated when next read"""
+        self._stats.missions.missions.append(mission)
+        self._pending_completion_types.append(mission.completion_type)
+        self._totals_pending = True
         
-        if transaction.transaction_type == "purchase":
-            self.stats.inventory.total_money_spent += total_cost
-            self.stats.inventory.total_items_purchased += transaction.quantity
-        elif transaction.transaction_type == "sale":
-            self.stats.inventory.total_money_earned += total_cost
-            self.stats.inventory.total_items_sold += transaction.quantity
+    def _update_totals(self) -> None:
+        """Fold the transactions and missions added since the last call into the totals"""
+        inventory = self._stats.inventory
         
+        # A single pass in local variables over the new part of the columns. numpy is
+        # left out of the build, and masking with itertools.compress() measured slower
+        # than this loop, since it needs one pass per total.
+        spent = inventory.total_money_spent
+        earned = inventory.total_money_earned
+        purchased = inventory.total_items_purchased
+        sold = inventory.total_items_sold
+        for total_cost, quantity, kind in zip(inventory.costs, inventory.quantities, inventory.kinds):
+            if kind == TRANSACTION_PURCHASE:
+                spent += total_cost
+                purchased += quantity
+            elif kind == TRANSACTION_SALE:
+                earned += total_cost
+                sold += quantity
+        inventory.total_money_spent = spent
+        inventory.total_money_earned = earned
+        inventory.total_items_purchased = purchased
+        inventory.total_items_sold = sold
+                
         # Update net profit
-        self.stats.inventory.net_profit = (
-            self.stats.inventory.total_money_earned - 
-            self.stats.inventory.total_money_spent
-        )
-    
-    def _add_mission(self, mission: MissionRecord) -> None:
-        """Add a mission and update mission statistics"""
-        self.stats.missions.missions.append(mission)
+        inventory.net_profit = earned - spent
+        inventory.total_transactions += len(inventory.costs)
+        del inventory.costs[:], inventory.quantities[:], inventory.kinds[:]
         
-        # Update mission counters
-        if mission.completion_type.lower() == "complete":
-            self.stats.missions.missions_completed += 1
-        elif mission.completion_type.lower() == "abandon":
-            self.stats.missions.missions_abandoned += 1
-        else:
+        # Count the new missions per completion type first, so each distinct type is
+        # lowered and mapped to its counter once rather than once per mission
+        missions = self._stats.missions
+        counts: Dict[str, int] = {}
+        for completion_type in self._pending_completion_types:
+            counts[completion_type] = counts.get(completion_type, 0) + 1
+        for completion_type, count in counts.items():
             # Count any other completion type as failed
-            self.stats.missions.missions_failed += 1
+            counter = MISSION_COUNTERS.get(completion_type.lower(), 'missions_failed')
+            setattr(missions, counter, getattr(missions, counter) + count)
+        self._pending_completion_types.clear()
+        
+        self._totals_pending = False
     
-    def get_recent_transactions(self, limit: int = 10) -> List[TransactionItem]:
-        """Get the most recent transactions"""
-        return self.stats.inventory.transactions[-limit:] if self.stats.inventory.transactions else []
+    def get_recent_transactions(self, limit: int = 10, newest_first: bool = False) -> List[TransactionItem]:
+        """Get the most recent transactions, oldest first unless newest_first is set
+        
+        Only the last `limit` records are visited, from the right end of the bounded
+        deque, so the cost does not grow with the session like a list slice would.
+        """
+        recent = list(islice(reversed(self._stats.inventory.transactions), limit))
+        if not newest_first:
+            recent.reverse()
+        return recent
     
-    def get_recent_missions(self, limit: int = 10) -> List[MissionRecord]:
-        """Get the most recent missions"""
-        return self.stats.missions.missions[-limit:] if self.stats.missions.missions else []
+    def get_recent_missions(self, limit: int = 10, newest_first: bool = False) -> List[MissionRecord]:
+        """Get the most recent missions, like get_recent_transactions()"""
+        recent = list(islice(reversed(self._stats.missions.missions), limit))
+        if not newest_first:
+            recent.reverse()
+        return recent
     
     def get_transaction_summary(self) -> str:
         """Get a formatted summary of recent transactions"""
-        recent = self.get_recent_transactions(5)
+        recent = self.get_recent_transactions(5, newest_first=True)
         if not recent:
             return "No recent transactions"
         
-        summary = "=== Recent Transactions ===\n"
-        for trans in reversed(recent):  # Show most recent first
-            time_str = trans.timestamp.strftime('%H:%M:%S') if trans.timestamp else 'Unknown'
+        lines = ["=== Recent Transactions ==="]
+        for trans in recent:  # Show most recent first
+            time_str = trans.time_str
             action = "Bought" if trans.transaction_type == "purchase" else "Sold"
             total_cost = trans.price * trans.quantity
-            summary += f"{time_str} - {action} {trans.quantity}x {trans.item_name} for {total_cost:,.0f} aUEC at {trans.location}\n"
+            lines.append(f"{time_str} - {action} {trans.quantity}x {trans.item_name} for {total_cost:,.0f} aUEC at {trans.location}")
         
-        return summary.strip()
+        return "\n".join(lines).strip()
     
     def get_mission_summary(self) -> str:
         """Get a formatted summary of recent missions"""
-        recent = self.get_recent_missions(5)
+        recent = self.get_recent_missions(5, newest_first=True)
         if not recent:
             return "No recent missions"
         
-        summary = "=== Recent Missions ===\n"
-        for mission in reversed(recent):  # Show most recent first
-            time_str = mission.timestamp.strftime('%H:%M:%S') if mission.timestamp else 'Unknown'
+        lines = ["=== Recent Missions ==="]
+        for mission in recent:  # Show most recent first
+            time_str = mission.time_str
             status = mission.completion_type
-            summary += f"{time_str} - {status}: {mission.player_name} - {mission.reason} (ID: {mission.mission_id[:8]}...)\n"
+            lines.append(f"{time_str} - {status}: {mission.player_name} - {mission.reason} (ID: {mission.mission_id[:8]}...)")
         
-        return summary.strip()
+        return "\n".join(lines).strip()
     
     def parse_file(self, file_path: str, start_from_end: bool = True) -> None:
         """Parse the entire log file or from a specific position"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                if start_from_end:
-                    # Read from end to get current session data
-                    lines = f.readlines()
-                    # Process last 1000 lines to get current state
-                    for line in lines[-1000:]:
-                        self.parse_line(line)
-                else:
-                    # Read entire file
-                    for line in f:
-                        self.parse_line(line)
+            if start_from_end:
+                # Process last 1000 lines to get current session data
+                self.parse_lines(self._read_last_lines(file_path, 1000))
+            else:
+                # Read entire file in large blocks of complete lines, each scanned for
+                # events in one pass by parse_chunk() instead of line by line. This stays
+                # in one process: the scan keeps up with hundreds of MB per second, while
+                # worker processes would have to be spawned (Windows has no fork) and
+                # their session state, which depends on line order, merged afterwards.
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    remainder = ''
+                    for block in iter(partial(f.read, FILE_BUFFER_SIZE), ''):
+                        block = remainder + block
+                        end = block.rfind('\n') + 1
+                        remainder = block[end:]
+                        if end:
+                            self.parse_chunk(block[:end])
+                    if remainder:
+                        self.parse_chunk(remainder)
         except Exception as e:
             print(f"Error parsing file: {e}")
+            
+    @staticmethod
+    def _read_last_lines(file_path: str, count: int) -> List[str]:
+        """Get the last `count` lines of a file without keeping the rest of it
+        
+        The file is memory-mapped just long enough to find the start of those lines
+        by searching backwards for newlines, and only they are decoded. Files that
+        can't be mapped are streamed through a window of `count` lines instead.
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty, or not a regular file (e.g. a pipe)
+                tail = b''.join(deque(f, maxlen=count))
+            else:
+                with mm:
+                    size = len(mm)
+                    start = size - 1 if mm[size - 1] == 0x0A else size  # Ignore the final newline
+                    for _ in range(count):
+                        start = mm.rfind(b'\n', 0, start)
+                        if start < 0:
+                            break
+                    tail = mm[start + 1:]
+        return tail.decode('utf-8', 'ignore').splitlines()
     
     def get_stats_dict(self) -> Dict[str, Any]:
         """Get statistics as a dictionary"""
-        stats_dict = asdict(self.stats)
-        
-        # Convert datetime objects to strings for JSON serialization
-        if stats_dict['session']['start_time']:
-            stats_dict['session']['start_time'] = self.stats.session.start_time.isoformat()
-        if stats_dict['session']['end_time']:
-            stats_dict['session']['end_time'] = self.stats.session.end_time.isoformat()
-        if stats_dict['last_update']:
-            stats_dict['last_update'] = self.stats.last_update.isoformat()
+        with self.lock:
+            self._update_totals()
+            return self._get_stats_dict()
+    
+    def _get_stats_dict(self) -> Dict[str, Any]:
+        """Build the dictionary for get_stats_dict(), the caller holds the lock
         
-        # Convert transaction timestamps
-        for i, transaction in enumerate(stats_dict['inventory']['transactions']):
-            if self.stats.inventory.transactions[i].timestamp:
-                transaction['timestamp'] = self.stats.inventory.transactions[i].timestamp.isoformat()
+        Built field by field, with datetime objects converted to strings for JSON
+        serialization along the way.
+        """
+        stats = self._stats
+        return {
+            'session': stats.session.to_dict(),
+            'inventory': stats.inventory.to_dict(),
+            'missions': stats.missions.to_dict(),
+            'last_update': stats.last_update.isoformat() if stats.last_update else None,
+        }
+    
+    def get_stats_view(self, *sections: str) -> Dict[str, Any]:
+        """Get some sections of get_stats_dict() along with the last update time
         
-        # Convert mission timestamps
-        for i, mission in enumerate(stats_dict['missions']['missions']):
-            if self.stats.missions.missions[i].timestamp:
-                mission['timestamp'] = self.stats.missions.missions[i].timestamp.isoformat()
-            
-        return stats_dict
+        Only the requested sections are built, so reading the session info doesn't
+        convert every transaction record. Unknown sections are None.
+        """
+        with self.lock:
+            self._update_totals()
+            stats = self._stats
+            view = {
+                section: getattr(stats, section).to_dict() if section in STATS_SECTIONS else None
+                for section in sections
+            }
+            view['last_update'] = stats.last_update.isoformat() if stats.last_update else None
+            return view
     
     def get_formatted_stats(self) -> str:
         """Get formatted statistics as a string"""
-        session = self.stats.session
-        inv = self.stats.inventory
-        missions = self.stats.missions
+        stats = self.stats
+        session = stats.session
+        inv = stats.inventory
+        missions = stats.missions
         
         uptime_hours = session.uptime_seconds / 3600 if session.uptime_seconds else 0
         
@@ -522,7 +880,7 @@ Total Spent: {inv.total_money_spent:,.0f} aUEC
 Net Profit: {inv.net_profit:,.0f} aUEC
 Items Purchased: {inv.total_items_purchased}
 Items Sold: {inv.total_items_sold}
-Recent Transactions: {len(inv.transactions)}
+Recent Transactions: {inv.total_transactions}
 
 {self.get_transaction_summary()}
 
@@ -531,20 +889,45 @@ Recent Transactions: {len(inv.transactions)}
 Completed: {missions.missions_completed}
 Abandoned: {missions.missions_abandoned}
 Failed: {missions.missions_failed}
-Total Missions: {len(missions.missions)}
+Total Missions: {missions.total_missions}
 
 {self.get_mission_summary()}
 
-Last Update: {self.stats.last_update.strftime('%H:%M:%S') if self.stats.last_update else 'Never'}
+Last Update: {self._stats.last_update.strftime('%H:%M:%S') if self._stats.last_update else 'Never'}
 """
 
     def reset_stats(self) -> None:
         """Reset all statistics to default values"""
-        self.stats = GameStats(
-            session=SessionInfo(),
-            inventory=InventoryInfo(),
-            missions=MissionInfo()
-        )
+        with self.lock:
+            self._stats = GameStats(
+                session=SessionInfo(),
+                inventory=InventoryInfo(),
+                missions=MissionInfo()
+            )
+            self._pending_completion_types = []
+            self._totals_pending = False
+            self._session_info_complete = False
+            self.revision += 1
+            self.updated.notify_all()
+        
+    def export_state(self) -> Dict[str, Any]:
+        """Get a picklable snapshot of the parser state"""
+        return {'version': STATE_VERSION, 'stats': self.stats}
+    
+    def restore_state(self, state: Dict[str, Any]) -> bool:
+        """Restore a snapshot from export_state() - returns False if it is incompatible"""
+        if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+            return False
+        with self.lock:
+            self._stats = state['stats']
+            # Saved totals already include every record
+            self._pending_completion_types = []
+            self._totals_pending = False
+            session = self._stats.session
+            self._session_info_complete = bool(session.branch and session.game_version)
+            self.revision += 1
+            self.updated.notify_all()
+        return True
 
 
 if __name__ == "__main__":
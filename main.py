@@ -8,6 +8,8 @@ gameplay statistics extraction and display for streaming and analysis.
 
 import sys
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -23,6 +25,13 @@ except ImportError as e:
     GUI_AVAILABLE = False
     from log_parser import SCLogParser
 
+# User settings kept between runs, such as the last log file used
+if os.name == 'nt':
+    CONFIG_DIR = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~')), 'V3SCInfo')
+else:
+    CONFIG_DIR = os.path.join(os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config')), 'v3scinfo')
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
+
 
 def run_gui():
     """Run the GUI version"""
@@ -56,8 +65,37 @@ def run_cli(log_file_path: str):
         return False
 
 
+def load_last_log():
+    """Get the log file path saved by save_last_log(), or None"""
+    try:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            last_log = json.load(f).get('last_log')
+        return last_log if isinstance(last_log, str) else None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable config: {e}")
+        return None
+
+
+def save_last_log(file_path: str):
+    """Remember a log file path for the next auto-detection"""
+    try:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        temp_file = CONFIG_FILE + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'last_log': os.path.abspath(file_path)}, f)
+        os.replace(temp_file, CONFIG_FILE)
+    except Exception as e:
+        print(f"Failed to save config: {e}")
+
+
 def auto_detect_log():
-    """Try to auto-detect the Star Citizen log file"""
+    """Try to auto-detect the Star Citizen log file, the last one used first"""
+    last_log = load_last_log()
+    if last_log and os.path.exists(last_log):
+        return last_log
+    
     common_paths = [
         "Game.log",  # Current directory
         "../Game.log",  # Parent directory
@@ -68,10 +106,16 @@ def auto_detect_log():
         "G:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log",
     ]
     
-    for path in common_paths:
-        if os.path.exists(path):
-            return path
-    return None
+    # The paths are on different drives, where a miss on a spun-down disk can take a
+    # while - check them all at once, then take the first existing one in list order
+    executor = ThreadPoolExecutor(max_workers=len(common_paths))
+    try:
+        for path, exists in zip(common_paths, executor.map(os.path.exists, common_paths)):
+            if exists:
+                return path
+        return None
+    finally:
+        executor.shutdown(wait=False)  # Don't wait on slower drives once a path is found
 
 
 def main():
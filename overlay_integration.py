@@ -5,16 +5,225 @@ This module provides the foundation for creating overlays and integrations
 with external platforms like Overwolf or Twitch extensions.
 """
 
+import gzip
 import json
 import threading
 import time
-import socket
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
 
-from log_parser import SCLogParser
+from log_parser import SCLogParser, STATS_SECTIONS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Compact UTF-8 output for the stdlib fallback, matching what orjson produces
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to compact JSON, or indented for people to read, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(data)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return _COMPACT_ENCODER.encode(data).encode('utf-8')
+
+
+# Endpoints served from the parser stats, with the stats sections each one returns
+# (None for everything)
+STATS_ROUTES = {
+    '/stats': None,
+    '/stats/session': ('session',),
+    '/stats/performance': ('performance',),
+    '/stats/inventory': ('inventory',),
+}
+
+# Sections returned by /stats/batch without a fields parameter
+BATCH_DEFAULT_FIELDS = 'session,inventory,missions'
+
+# Stats responses are gzipped for clients accepting it once they reach this size,
+# smaller ones gain too little to be worth it
+GZIP_MIN_SIZE = 1024
+
+# Seconds the /health response, and the timestamp in it, is reused for
+HEALTH_MAX_AGE = 1.0
+
+# Seconds between keep-alive comments on an idle /stats/stream, and the minimum
+# seconds between two of its events (updates in between are sent together)
+STREAM_KEEPALIVE = 15.0
+STREAM_MIN_INTERVAL = 0.25
+# Open /stats/stream connections allowed at once, each keeps a request thread for as
+# long as it is open, so the rest of StatsHTTPServer.max_threads stays for other requests
+MAX_STREAMS = 4
+
+# Raw response for connections turned away by StatsHTTPServer when all request threads
+# are busy, sent before the request is read
+SERVICE_UNAVAILABLE_RESPONSE = (
+    b'HTTP/1.1 503 Service Unavailable\r\n'
+    b'Content-Length: 0\r\n'
+    b'Retry-After: 1\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Connection: close\r\n'
+    b'\r\n'
+)
+
+# Response for any other path, it never changes so it is serialized once at import
+API_DOCS_JSON = dump_json(pretty=True, data={
+    'endpoints': {
+        '/stats': 'All statistics',
+        '/stats/session': 'Session information only',
+        '/stats/performance': 'Performance data only', 
+        '/stats/inventory': 'Trading & transaction data (placeholder)',
+        '/stats/batch?fields=session,inventory,missions': 'Several sections in one response',
+        '/stats/stream': 'All statistics as server-sent events, after every update',
+        '/stats...?pretty=1': 'Indented output, for reading the stats endpoints by hand',
+        '/health': 'Health check'
+    },
+    'methods': ['GET'],
+    'format': 'JSON'
+})
+
+
+# Overwolf app manifest template written by OverwolfIntegration
+OVERWOLF_MANIFEST = {
+    "manifest_version": 1,
+    "type": "WebApp",
+    "meta": {
+        "name": "Star Citizen Stats",
+        "description": "Real-time Star Citizen statistics overlay",
+        "author": "Community Tool",
+        "version": "1.0.0.0",
+        "minimum-overwolf-version": "0.77.10.0",
+        "icon": "icon.png",
+        "icon_gray": "icon_gray.png"
+    },
+    "permissions": [
+        "Extensions",
+        "Hotkeys",
+        "GameInfo",
+        "Web"
+    ],
+    "channel-id": 0,
+    "dependencies": None,
+    "data": {
+        "start_window": {
+            "file": "index.html",
+            "show_in_taskbar": True,
+            "transparent": True,
+            "resizable": False,
+            "show_minimize": True,
+            "clickthrough": False,
+            "disable_rightclick": False,
+            "use_os_windowing": False,
+            "size": {"width": 400, "height": 300},
+            "min_size": {"width": 300, "height": 200},
+            "max_size": {"width": 800, "height": 600}
+        },
+        "windows": {
+            "overlay": {
+                "file": "overlay.html",
+                "in_game_only": True,
+                "focus_game_takeover": "ReleaseOnHidden",
+                "size": {"width": 300, "height": 200},
+                "transparent": True,
+                "clickthrough": True
+            }
+        },
+        "game_targeting": {
+            "type": "dedicated",
+            "game_ids": [21820]  # Star Citizen game ID in Overwolf
+        },
+        "launch_events": [
+            {
+                "event": "GameLaunch",
+                "event_data": {
+                    "game_ids": [21820]
+                },
+                "start_minimized": True
+            }
+        ]
+    }
+}
+
+# Twitch extension manifest template written by TwitchIntegration
+TWITCH_MANIFEST = {
+    "name": "Star Citizen Stats",
+    "version": "1.0.0",
+    "description": "Live Star Citizen gameplay statistics",
+    "author_name": "Community Tool",
+    "bits_enabled": False,
+    "config_url": "",
+    "live_config_url": "",
+    "summary": "Real-time SC stats",
+    "support_email": "support@example.com",
+    "views": {
+        "panel": {
+            "viewer_url": "panel.html",
+            "height": 300,
+            "can_link_external_content": False
+        },
+        "video_overlay": {
+            "viewer_url": "overlay.html",
+            "can_link_external_content": False
+        }
+    },
+    "allowlisted_config_urls": [],
+    "allowlisted_panel_urls": []
+}
+
+
+class StatsHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a cap on the number of request threads
+    
+    Past the cap new connections are answered with a 503 right away and closed, so a
+    flood of overlay clients can't spawn unbounded threads, and the accept loop never
+    waits for a thread to free up.
+    """
+    allow_reuse_address = True  # Restart on the same port without waiting out TIME_WAIT
+    request_queue_size = 64
+    max_threads = 16
+    
+    def __init__(self, *args, **kwargs):
+        self._thread_slots = threading.BoundedSemaphore(self.max_threads)
+        super().__init__(*args, **kwargs)
+        
+    def process_request(self, request, client_address):
+        """Hand the request to a new thread if one of the slots is free"""
+        if not self._thread_slots.acquire(blocking=False):
+            self.reject_request(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self._thread_slots.release()
+            raise
+            
+    def reject_request(self, request):
+        """Answer a connection past the thread cap with a 503 and close it, without blocking"""
+        try:
+            request.setblocking(False)
+            try:
+                request.recv(65536)  # Take what was sent already, so closing doesn't reset
+            except (BlockingIOError, InterruptedError):
+                pass
+            request.send(SERVICE_UNAVAILABLE_RESPONSE)
+        except OSError:
+            pass  # Client gone or its buffer full, it only misses the 503
+        self.shutdown_request(request)
+            
+    def process_request_thread(self, request, client_address):
+        """Handle the request on its thread, then give the slot back"""
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._thread_slots.release()
 
 
 class StatsServer:
@@ -27,14 +236,27 @@ class StatsServer:
         self.server_thread = None
         self.running = False
         
+        # Serialized stats responses, and gzipped ones, by cache key for the parser
+        # revision they were built from
+        self._cache: Dict[str, bytes] = {}
+        self._gzip_cache: Dict[str, bytes] = {}
+        self._cache_revision = None
+        self._cache_lock = threading.Lock()
+        # Slots for open /stats/stream connections
+        self.stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+        # time.monotonic() when the /health response was serialized, and the response
+        self._health = (float('-inf'), b'')
+        
     def start_server(self):
         """Start the HTTP server"""
         if self.running:
             return
             
         try:
-            handler = lambda *args: StatsHTTPHandler(self.parser, *args)
-            self.server = HTTPServer(('localhost', self.port), handler)
+            # The handler class is bound to this server, the standard constructor stays in use
+            handler = type('BoundStatsHTTPHandler', (StatsHTTPHandler,), {'stats_server': self})
+            # One thread per connection, so a slow overlay client can't hold up the others
+            self.server = StatsHTTPServer(('localhost', self.port), handler)
             self.running = True
             
             self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
@@ -57,85 +279,187 @@ class StatsServer:
     def is_running(self) -> bool:
         """Check if server is running"""
         return self.running
+    
+    def get_cached(self, key: str, sections: Optional[Tuple[str, ...]],
+                   accept_gzip: bool = False, pretty: bool = False) -> Tuple[bytes, Optional[str]]:
+        """Get the serialized stats response for the given sections (None for all)
+        
+        Overlays poll far more often than the log changes, so each response is built
+        and serialized once per parser revision, stored under `key` (which has to tell
+        pretty responses apart). Section endpoints only read their own sections of the
+        stats. Returns the body and its content encoding, gzip if the client accepts it
+        and the body is large enough.
+        """
+        with self._cache_lock:
+            revision = self.parser.revision
+            if revision != self._cache_revision:
+                self._cache_revision = revision
+                self._cache.clear()
+                self._gzip_cache.clear()
+            body = self._cache.get(key)
+            compressed = self._gzip_cache.get(key) if accept_gzip else None
+        
+        # Built, serialized and compressed without holding the cache lock, so cache hits
+        # on other threads don't wait behind a rebuild. A result is only stored if the
+        # parser hasn't moved on meanwhile; two threads missing at once both build it.
+        if body is None:
+            with self.parser.lock:
+                revision = self.parser.revision
+                if sections is None:
+                    response = self.parser.get_stats_dict()
+                else:
+                    response = self.parser.get_stats_view(*sections)
+            body = dump_json(response, pretty)
+            self._store_cached(self._cache, key, body, revision)
+            
+        if not accept_gzip or len(body) < GZIP_MIN_SIZE:
+            return body, None
+        if compressed is None:
+            # Fastest level, most of the size is saved already and it runs per update
+            compressed = gzip.compress(body, compresslevel=1)
+            self._store_cached(self._gzip_cache, key, compressed, revision)
+        return compressed, 'gzip'
+    
+    def _store_cached(self, cache: Dict[str, bytes], key: str, data: bytes, revision: int) -> None:
+        """Store a response built from the given parser revision, unless the cache moved past it"""
+        with self._cache_lock:
+            if revision == self._cache_revision:
+                cache[key] = data
+    
+    def get_health(self) -> bytes:
+        """Get the serialized /health response, rebuilt at most every HEALTH_MAX_AGE seconds"""
+        now = time.monotonic()
+        built, body = self._health
+        if now - built >= HEALTH_MAX_AGE:
+            # Replaced as a whole, so concurrent requests at worst both rebuild it
+            body = dump_json({
+                'status': 'ok',
+                'timestamp': datetime.now().isoformat()
+            })
+            self._health = (now, body)
+        return body
 
 
 class StatsHTTPHandler(BaseHTTPRequestHandler):
     """HTTP request handler for stats API"""
     
-    def __init__(self, parser: SCLogParser, *args):
-        self.parser = parser
-        super().__init__(*args)
+    # Responses are small and written whole, send them without waiting on Nagle's algorithm
+    disable_nagle_algorithm = True
+    # Buffer the output, so headers and body leave in one send when the request is done
+    wbufsize = -1
+    # Keep connections open between requests (every response has a Content-Length),
+    # polling overlays then reuse one connection. Idle ones are closed after a few
+    # seconds, as each holds one of the server's request threads meanwhile.
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+    
+    # Set on the subclass created by StatsServer.start_server()
+    stats_server: Optional[StatsServer] = None
         
     def do_GET(self):
         """Handle GET requests"""
         try:
-            parsed_url = urlparse(self.path)
-            path = parsed_url.path
-            
-            # Enable CORS for web-based overlays
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            self.end_headers()
+            # Request targets are plain paths here, a split at the query is all the parsing needed
+            path, _, query = self.path.partition('?')
+            if path == '/stats/stream':
+                self._stream_stats()
+                return
+            content_encoding = None
+            accept_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            params = parse_qs(query) if query else {}
+            # Compact JSON for overlays, indented on request for debugging
+            pretty = params.get('pretty', [''])[0] == '1'
             
-            if path == '/stats':
-                # Return all statistics
-                response = self.parser.get_stats_dict()
-                
-            elif path == '/stats/session':
-                # Return only session information
-                response = {
-                    'session': self.parser.get_stats_dict()['session'],
-                    'last_update': self.parser.get_stats_dict().get('last_update')
-                }
+            if path in STATS_ROUTES:
+                # All statistics or a single section, shared between requests until
+                # the parser changes
+                key = f"{path}?pretty=1" if pretty else path
+                body, content_encoding = self.stats_server.get_cached(key, STATS_ROUTES[path], accept_gzip, pretty)
                 
-            elif path == '/stats/performance':
-                # Return only performance data
-                response = {
-                    'performance': self.parser.get_stats_dict()['performance'],
-                    'last_update': self.parser.get_stats_dict().get('last_update')
-                }
-                
-            elif path == '/stats/inventory':
-                # Return only inventory data
-                response = {
-                    'inventory': self.parser.get_stats_dict()['inventory'],
-                    'last_update': self.parser.get_stats_dict().get('last_update')
-                }
+            elif path == '/stats/batch':
+                # Several sections in one response, e.g. ?fields=session,inventory
+                # Unknown names are ignored, the cache key lists the rest in a fixed order
+                fields = params.get('fields', [BATCH_DEFAULT_FIELDS])[0].split(',')
+                sections = tuple(section for section in STATS_SECTIONS if section in fields)
+                key = f"{path}?fields={','.join(sections)}" + ("&pretty=1" if pretty else "")
+                body, content_encoding = self.stats_server.get_cached(key, sections, accept_gzip, pretty)
                 
             elif path == '/health':
                 # Health check endpoint
-                response = {
-                    'status': 'ok',
-                    'timestamp': datetime.now().isoformat()
-                }
+                body = self.stats_server.get_health()
                 
             else:
                 # API documentation
-                response = {
-                    'endpoints': {
-                        '/stats': 'All statistics',
-                        '/stats/session': 'Session information only',
-                        '/stats/performance': 'Performance data only', 
-                        '/stats/inventory': 'Trading & transaction data (placeholder)',
-                        '/health': 'Health check'
-                    },
-                    'methods': ['GET'],
-                    'format': 'JSON'
-                }
-            
-            # Send response
-            json_response = json.dumps(response, indent=2)
-            self.wfile.write(json_response.encode('utf-8'))
+                body = API_DOCS_JSON
             
         except Exception as e:
             self.send_error(500, f"Internal server error: {str(e)}")
+            return
+            
+        # Send response, enabling CORS for web-based overlays
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if content_encoding:
+            self.send_header('Content-Encoding', content_encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
+        self.wfile.write(body)
+            
+    def _stream_stats(self):
+        """Send all statistics as server-sent events, one after each parser update
+        
+        The connection stays open, and keeps one of the server's request threads,
+        until the client goes away or the server stops. Past MAX_STREAMS open streams
+        new ones are turned away with a 503.
+        """
+        if not self.stats_server.stream_slots.acquire(blocking=False):
+            self.send_error(503, "Too many open streams")
+            return
+        try:
+            self._send_stream()
+        finally:
+            self.stats_server.stream_slots.release()
+            
+    def _send_stream(self):
+        """Event loop behind _stream_stats(), run while holding a stream slot"""
+        parser = self.stats_server.parser
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')  # The stream has no length, it ends with the connection
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        revision = None
+        try:
+            while self.stats_server.running:
+                with parser.updated:
+                    parser.updated.wait_for(lambda: parser.revision != revision, STREAM_KEEPALIVE)
+                    updated = parser.revision != revision
+                    revision = parser.revision
+                    
+                if updated:
+                    body, _ = self.stats_server.get_cached('/stats', None)
+                    # Compact JSON has no line breaks, so it fits in one data field
+                    self.wfile.write(b'data: ' + body + b'\n\n')
+                else:
+                    # Comment, keeps idle connections open and finds clients that went away
+                    self.wfile.write(b': keep-alive\n\n')
+                self.wfile.flush()
+                
+                if updated:
+                    time.sleep(STREAM_MIN_INTERVAL)
+        except OSError:
+            pass  # Client disconnected
             
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS"""
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
@@ -171,9 +495,12 @@ class WebSocketStatsServer:
 class OverwolfIntegration:
     """Integration helper for Overwolf game overlay"""
     
-    def __init__(self, parser: SCLogParser):
+    def __init__(self, parser: SCLogParser, stats_server: Optional[StatsServer] = None):
         self.parser = parser
-        self.stats_server = StatsServer(parser)
+        # A server passed in is shared with other integrations, it is started here if
+        # needed but left running on stop
+        self.owns_server = stats_server is None
+        self.stats_server = stats_server or StatsServer(parser)
         
     def start_integration(self):
         """Start Overwolf integration"""
@@ -187,75 +514,16 @@ class OverwolfIntegration:
         
     def stop_integration(self):
         """Stop Overwolf integration"""
-        self.stats_server.stop_server()
+        if self.owns_server:
+            self.stats_server.stop_server()
         print("Overwolf integration stopped")
         
     def create_overwolf_manifest(self):
         """Create a basic Overwolf app manifest template"""
-        manifest = {
-            "manifest_version": 1,
-            "type": "WebApp",
-            "meta": {
-                "name": "Star Citizen Stats",
-                "description": "Real-time Star Citizen statistics overlay",
-                "author": "Community Tool",
-                "version": "1.0.0.0",
-                "minimum-overwolf-version": "0.77.10.0",
-                "icon": "icon.png",
-                "icon_gray": "icon_gray.png"
-            },
-            "permissions": [
-                "Extensions",
-                "Hotkeys",
-                "GameInfo",
-                "Web"
-            ],
-            "channel-id": 0,
-            "dependencies": None,
-            "data": {
-                "start_window": {
-                    "file": "index.html",
-                    "show_in_taskbar": True,
-                    "transparent": True,
-                    "resizable": False,
-                    "show_minimize": True,
-                    "clickthrough": False,
-                    "disable_rightclick": False,
-                    "use_os_windowing": False,
-                    "size": {"width": 400, "height": 300},
-                    "min_size": {"width": 300, "height": 200},
-                    "max_size": {"width": 800, "height": 600}
-                },
-                "windows": {
-                    "overlay": {
-                        "file": "overlay.html",
-                        "in_game_only": True,
-                        "focus_game_takeover": "ReleaseOnHidden",
-                        "size": {"width": 300, "height": 200},
-                        "transparent": True,
-                        "clickthrough": True
-                    }
-                },
-                "game_targeting": {
-                    "type": "dedicated",
-                    "game_ids": [21820]  # Star Citizen game ID in Overwolf
-                },
-                "launch_events": [
-                    {
-                        "event": "GameLaunch",
-                        "event_data": {
-                            "game_ids": [21820]
-                        },
-                        "start_minimized": True
-                    }
-                ]
-            }
-        }
-        
         # Save manifest template
         try:
-            with open('overwolf_manifest.json', 'w') as f:
-                json.dump(manifest, f, indent=2)
+            with open('overwolf_manifest.json', 'wb') as f:
+                f.write(dump_json(OVERWOLF_MANIFEST, pretty=True))
             print("Overwolf manifest template created: overwolf_manifest.json")
         except Exception as e:
             print(f"Failed to create Overwolf manifest: {e}")
@@ -264,9 +532,12 @@ class OverwolfIntegration:
 class TwitchIntegration:
     """Integration helper for Twitch extensions"""
     
-    def __init__(self, parser: SCLogParser):
+    def __init__(self, parser: SCLogParser, stats_server: Optional[StatsServer] = None):
         self.parser = parser
-        self.stats_server = StatsServer(parser, port=8090)
+        # A server passed in is shared with other integrations, it is started here if
+        # needed but left running on stop
+        self.owns_server = stats_server is None
+        self.stats_server = stats_server or StatsServer(parser, port=8090)
         
     def start_integration(self):
         """Start Twitch integration"""
@@ -281,44 +552,18 @@ class TwitchIntegration:
         
     def stop_integration(self):
         """Stop Twitch integration"""
-        self.stats_server.stop_server()
+        if self.owns_server:
+            self.stats_server.stop_server()
         print("Twitch integration stopped")
         
     def create_twitch_extension_template(self):
         """Create basic Twitch extension files template"""
-        
-        # Extension manifest
-        manifest = {
-            "name": "Star Citizen Stats",
-            "version": "1.0.0",
-            "description": "Live Star Citizen gameplay statistics",
-            "author_name": "Community Tool",
-            "bits_enabled": False,
-            "config_url": "",
-            "live_config_url": "",
-            "summary": "Real-time SC stats",
-            "support_email": "support@example.com",
-            "views": {
-                "panel": {
-                    "viewer_url": "panel.html",
-                    "height": 300,
-                    "can_link_external_content": False
-                },
-                "video_overlay": {
-                    "viewer_url": "overlay.html",
-                    "can_link_external_content": False
-                }
-            },
-            "allowlisted_config_urls": [],
-            "allowlisted_panel_urls": []
-        }
-        
         # Basic HTML templates would go here
         # This is a simplified template for demonstration
         
         try:
-            with open('twitch_manifest.json', 'w') as f:
-                json.dump(manifest, f, indent=2)
+            with open('twitch_manifest.json', 'wb') as f:
+                f.write(dump_json(TWITCH_MANIFEST, pretty=True))
             print("Twitch extension template created: twitch_manifest.json")
         except Exception as e:
             print(f"Failed to create Twitch extension template: {e}")
@@ -329,9 +574,10 @@ class OverlayManager:
     
     def __init__(self, parser: SCLogParser):
         self.parser = parser
-        self.overwolf = OverwolfIntegration(parser)
-        self.twitch = TwitchIntegration(parser)
+        # One server for all integrations, rather than one each on its own port
         self.stats_server = StatsServer(parser)
+        self.overwolf = OverwolfIntegration(parser, self.stats_server)
+        self.twitch = TwitchIntegration(parser, self.stats_server)
         
     def start_all_integrations(self):
         """Start all available integrations"""
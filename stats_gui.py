@@ -12,16 +12,41 @@ from typing import Optional, Callable
 import threading
 import time
 import os
+import copy
+import queue
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
-from main import auto_detect_log
+from main import auto_detect_log, save_last_log
 
-from log_parser import SCLogParser, GameStats
-from file_monitor import SmartFileMonitor
+from log_parser import SCLogParser, DISPLAY_NAME_WIDTH
+from file_monitor import SmartFileMonitor, drain_errors
+
+# Headers of the recent records tables, each takes the first two lines of its textbox
+TRANSACTIONS_HEADER = " Time    | Action | Qty   | Item Name                          | Amount            | Location\n" + "-" * 118 + "\n"
+MISSIONS_HEADER = " Time    | Status     | Player         | Reason                      | Mission ID\n" + "-" * 105 + "\n"
+
+# Placeholder for the newest record shown before anything was drawn
+_NOTHING_SHOWN = object()
+
+
+@lru_cache(maxsize=256)
+def _format_auec(amount: float) -> str:
+    """Format an amount of aUEC with thousands separators, rounded to whole aUEC
+    
+    Cached, as the totals are formatted on every update but rarely change.
+    """
+    return f"{amount:,.0f} aUEC"
 
 
 class SCStatsGUI:
     """Modern GUI for Star Citizen statistics display"""
     
+    # How often the UI thread checks for pending stats updates (ms), stretched up to
+    # UPDATE_POLL_MAX_MS to leave twice the average redraw time between two redraws
+    UPDATE_POLL_MS = 50
+    UPDATE_POLL_MAX_MS = 1000
+    
     def __init__(self):
         # Set appearance mode and color theme
         ctk.set_appearance_mode("dark")  # "dark" or "light"
@@ -32,12 +57,42 @@ class SCStatsGUI:
         self.root.title("V3SCInfo - Star Citizen Stats Reader")
         self.root.geometry("800x800")
         
+        # Every font used by the widgets, created once and shared (needs the root window)
+        self._fonts = {
+            'title': ctk.CTkFont(size=24, weight="bold"),
+            'heading': ctk.CTkFont(size=16, weight="bold"),
+            'label': ctk.CTkFont(size=12, weight="bold"),
+            'button': ctk.CTkFont(size=14, weight="bold"),
+            'body': ctk.CTkFont(size=12),
+            'small': ctk.CTkFont(size=11),
+            'mono': ctk.CTkFont(family="Consolas", size=11),
+        }
+        
         # Initialize parser and state
         self.parser = SCLogParser()
         self.log_file_path = ""
+        self._log_file_exists = False  # Checked once per selected path
         self.monitoring = False
         self.file_monitor = None
         
+        # Monitor threads only leave a marker here, any number of updates between two
+        # polls are drawn once by the UI thread. A SimpleQueue put is a single C call,
+        # without the lock and condition of a bounded queue.Queue.
+        self._update_queue = queue.SimpleQueue()
+        self._update_durations = deque(maxlen=100)  # Seconds taken by the last redraws
+        self._update_poll_ms = self.UPDATE_POLL_MS
+        
+        # Background re-parse started by refresh_stats(), and the error it ended with
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_error: Optional[Exception] = None
+        
+        # Last value set on each display variable and widget option, by Tcl name
+        self._shown_values = {}
+        
+        # Newest record drawn in each recent records textbox, None for the empty text
+        self._shown_transaction = _NOTHING_SHOWN
+        self._shown_mission = _NOTHING_SHOWN
+        
         # Create GUI elements
         self.create_widgets()
         self.setup_layout()
@@ -45,6 +100,8 @@ class SCStatsGUI:
         # Auto-detect Star Citizen log file
         self.auto_detect_log_file()
         
+        self.root.after(self.UPDATE_POLL_MS, self._drain_updates)
+        
     def create_widgets(self):
         """Create all GUI widgets"""
         
@@ -55,7 +112,7 @@ class SCStatsGUI:
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="V3SCInfo - Star Citizen Stats Reader",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._fonts['title']
         )
         
         # Create variables for later use
@@ -63,7 +120,8 @@ class SCStatsGUI:
         self.status_var = tk.StringVar(value="Ready - Select a Game.log file to begin")
         
         # Main stats display - using tabview
-        self.stats_tabview = ctk.CTkTabview(self.root, width=760, height=700)
+        self.stats_tabview = ctk.CTkTabview(self.root, width=760, height=700,
+                                            command=self._on_tab_change)
         
         # Setup tab (for file selection and controls)
         self.stats_tabview.add("Setup")
@@ -83,8 +141,21 @@ class SCStatsGUI:
         
         self.create_setup_widgets()
         self.create_session_widgets()
-        self.create_inventory_widgets()
-        self.create_missions_widgets()
+        
+        # Inventory and Missions widgets are only built when their tab is first opened
+        self._tabs_built = {'Setup': True, 'Session': True, 'Inventory': False, 'Missions': False}
+        
+    def _on_tab_change(self):
+        """Build the widgets of a tab the first time it is opened"""
+        name = self.stats_tabview.get()
+        if self._tabs_built[name]:
+            return
+        if name == 'Inventory':
+            self.create_inventory_widgets()
+        elif name == 'Missions':
+            self.create_missions_widgets()
+        self._tabs_built[name] = True
+        self.update_display()
         
     def create_setup_widgets(self):
         """Create setup widgets in the Setup tab"""
@@ -94,14 +165,14 @@ class SCStatsGUI:
         file_section.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(file_section, text="Game Log File Selection", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         # File path display
         file_path_frame = ctk.CTkFrame(file_section)
         file_path_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(file_path_frame, text="Selected File:", 
-                    font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w", padx=5, pady=2)
+                    font=self._fonts['label']).pack(anchor="w", padx=5, pady=2)
         
         # Create file entry widget
         self.file_entry = ctk.CTkEntry(
@@ -138,7 +209,7 @@ class SCStatsGUI:
         control_section.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(control_section, text="Monitoring Controls", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         # Control buttons
         control_buttons_frame = ctk.CTkFrame(control_section)
@@ -150,7 +221,7 @@ class SCStatsGUI:
             text="Start Monitoring",
             command=self.toggle_monitoring,
             width=120,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['button']
         )
         self.start_button.pack(side="left", padx=5, pady=5)
         
@@ -175,13 +246,13 @@ class SCStatsGUI:
         status_section.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(status_section, text="Status", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         # Create status label
         self.status_label = ctk.CTkLabel(
             status_section,
             textvariable=self.status_var,
-            font=ctk.CTkFont(size=12)
+            font=self._fonts['body']
         )
         self.status_label.pack(pady=5)
         
@@ -190,7 +261,7 @@ class SCStatsGUI:
         instructions_section.pack(fill="both", expand=True, padx=10, pady=10)
         
         ctk.CTkLabel(instructions_section, text="Instructions", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         instructions_text = """1. Select your Star Citizen Game.log file using 'Browse' or 'Auto Detect'
 2. Click 'Start Monitoring' to begin real-time stats tracking
@@ -202,7 +273,7 @@ The Game.log file is typically located in:
 C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         
         instructions_label = ctk.CTkLabel(instructions_section, text=instructions_text, 
-                                         font=ctk.CTkFont(size=11), justify="left")
+                                         font=self._fonts['small'], justify="left")
         instructions_label.pack(fill="both", expand=True, padx=10, pady=5)
         
     def create_session_widgets(self):
@@ -213,43 +284,42 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         player_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(player_frame, text="Player Information", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
-        
-        self.player_name_var = tk.StringVar()
-        self.player_geid_var = tk.StringVar()
+                    font=self._fonts['heading']).pack(pady=5)
         
         info_grid = ctk.CTkFrame(player_frame)
         info_grid.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(info_grid, text="Name:", width=100).grid(row=0, column=0, sticky="w", padx=5)
-        ctk.CTkLabel(info_grid, textvariable=self.player_name_var, width=200).grid(row=0, column=1, sticky="w")
+        self.player_name_label = ctk.CTkLabel(info_grid, text="", width=200)
+        self.player_name_label.grid(row=0, column=1, sticky="w")
         
         ctk.CTkLabel(info_grid, text="Player ID:", width=100).grid(row=1, column=0, sticky="w", padx=5)
-        ctk.CTkLabel(info_grid, textvariable=self.player_geid_var, width=200).grid(row=1, column=1, sticky="w")
+        self.player_geid_label = ctk.CTkLabel(info_grid, text="", width=200)
+        self.player_geid_label.grid(row=1, column=1, sticky="w")
         
         # Game info frame
         game_frame = ctk.CTkFrame(self.session_frame)
         game_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(game_frame, text="Game Information", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
-        self.game_version_var = tk.StringVar()
-        self.branch_var = tk.StringVar()
-        self.map_name_var = tk.StringVar()
         self.uptime_var = tk.StringVar()
         
         game_grid = ctk.CTkFrame(game_frame)
         game_grid.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(game_grid, text="Version:", width=100).grid(row=0, column=0, sticky="w", padx=5)
-        ctk.CTkLabel(game_grid, textvariable=self.game_version_var, width=200).grid(row=0, column=1, sticky="w")
+        self.game_version_label = ctk.CTkLabel(game_grid, text="", width=200)
+        self.game_version_label.grid(row=0, column=1, sticky="w")
         
         ctk.CTkLabel(game_grid, text="Branch:", width=100).grid(row=1, column=0, sticky="w", padx=5)
-        ctk.CTkLabel(game_grid, textvariable=self.branch_var, width=200).grid(row=1, column=1, sticky="w")
+        self.branch_label = ctk.CTkLabel(game_grid, text="", width=200)
+        self.branch_label.grid(row=1, column=1, sticky="w")
         
         ctk.CTkLabel(game_grid, text="Map:", width=100).grid(row=2, column=0, sticky="w", padx=5)
-        ctk.CTkLabel(game_grid, textvariable=self.map_name_var, width=200).grid(row=2, column=1, sticky="w")
+        self.map_name_label = ctk.CTkLabel(game_grid, text="", width=200)
+        self.map_name_label.grid(row=2, column=1, sticky="w")
         
         ctk.CTkLabel(game_grid, text="Uptime:", width=100).grid(row=3, column=0, sticky="w", padx=5)
         ctk.CTkLabel(game_grid, textvariable=self.uptime_var, width=200).grid(row=3, column=1, sticky="w")
@@ -264,7 +334,7 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         trading_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(trading_frame, text="Trading Summary", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         self.total_earned_var = tk.StringVar()
         self.total_spent_var = tk.StringVar()
@@ -290,7 +360,7 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         items_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(items_frame, text="Transaction Stats", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         self.items_purchased_var = tk.StringVar()
         self.items_sold_var = tk.StringVar()
@@ -313,12 +383,10 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         transactions_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         ctk.CTkLabel(transactions_frame, text="Recent Transactions", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         # Scrollable text box for transactions
-        self.transactions_text = ctk.CTkTextbox(transactions_frame, width=750, height=200, 
-                                               font=ctk.CTkFont(family="Consolas", size=11))
-        self.transactions_text.pack(fill="both", expand=True, padx=10, pady=5)
+        self.transactions_text = self.create_records_text(transactions_frame, height=12)
         
     def create_missions_widgets(self):
         """Create missions information widgets with mission tracking"""
@@ -328,7 +396,7 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         mission_summary_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(mission_summary_frame, text="Mission Summary", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         self.missions_completed_var = tk.StringVar()
         self.missions_abandoned_var = tk.StringVar()
@@ -339,15 +407,15 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         mission_grid.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(mission_grid, text="Completed:", width=120).grid(row=0, column=0, sticky="w", padx=5)
-        self.completed_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_completed_var, width=200)
+        self.completed_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_completed_var, width=200, text_color="green")
         self.completed_label.grid(row=0, column=1, sticky="w")
         
         ctk.CTkLabel(mission_grid, text="Abandoned:", width=120).grid(row=1, column=0, sticky="w", padx=5)
-        self.abandoned_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_abandoned_var, width=200)
+        self.abandoned_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_abandoned_var, width=200, text_color="orange")
         self.abandoned_label.grid(row=1, column=1, sticky="w")
         
         ctk.CTkLabel(mission_grid, text="Failed:", width=120).grid(row=2, column=0, sticky="w", padx=5)
-        self.failed_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_failed_var, width=200)
+        self.failed_label = ctk.CTkLabel(mission_grid, textvariable=self.missions_failed_var, width=200, text_color="red")
         self.failed_label.grid(row=2, column=1, sticky="w")
         
         ctk.CTkLabel(mission_grid, text="Total Missions:", width=120).grid(row=3, column=0, sticky="w", padx=5)
@@ -358,12 +426,33 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         missions_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         ctk.CTkLabel(missions_frame, text="Recent Missions", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+                    font=self._fonts['heading']).pack(pady=5)
         
         # Scrollable text box for missions
-        self.missions_text = ctk.CTkTextbox(missions_frame, width=750, height=300, 
-                                           font=ctk.CTkFont(family="Consolas", size=11))
-        self.missions_text.pack(fill="both", expand=True, padx=10, pady=5)
+        self.missions_text = self.create_records_text(missions_frame, height=18)
+        
+    def create_records_text(self, parent, height: int) -> tk.Text:
+        """Create a scrollable text box for a recent records table, packed into parent
+        
+        A plain tk.Text with a CTkScrollbar beside it rather than a CTkTextbox, which
+        re-checks whether to show its scrollbars after every insert. Colored like a
+        CTkTextbox of the current appearance mode, height is in lines.
+        """
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        mode = 1 if ctk.get_appearance_mode() == "Dark" else 0
+        
+        text_frame = ctk.CTkFrame(parent, fg_color=theme["fg_color"])
+        text_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        textbox = tk.Text(text_frame, height=height, font=self._fonts['mono'], bg=theme["fg_color"][mode],
+                          fg=theme["text_color"][mode], insertbackground=theme["text_color"][mode],
+                          borderwidth=0, highlightthickness=0)
+        scrollbar = ctk.CTkScrollbar(text_frame, orientation="vertical", command=textbox.yview)
+        textbox.configure(yscrollcommand=scrollbar.set)
+        
+        scrollbar.pack(side="right", fill="y")
+        textbox.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        return textbox
 
         
     def setup_layout(self):
@@ -400,6 +489,9 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
     def set_log_file(self, file_path: str):
         """Set the log file path and update UI"""
         self.log_file_path = file_path
+        self._log_file_exists = os.path.exists(file_path)
+        if self._log_file_exists:
+            save_last_log(file_path)  # Found first by the next auto-detection
         self.file_path_var.set(file_path)
         self.update_status(f"Log file selected: {os.path.basename(file_path)}")
         
@@ -408,7 +500,7 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         
     def toggle_monitoring(self):
         """Toggle real-time monitoring"""
-        if not self.log_file_path or not os.path.exists(self.log_file_path):
+        if not self._log_file_exists:
             messagebox.showerror("Error", "Please select a valid Game.log file first.")
             return
             
@@ -430,7 +522,7 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         self.file_monitor = SmartFileMonitor(
             self.log_file_path, 
             self.parser, 
-            lambda: self.root.after(0, self.update_display)
+            self._notify_update
         )
         
         try:
@@ -450,20 +542,73 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
             self.file_monitor.stop_monitoring()
             self.file_monitor = None
         
+    def _notify_update(self):
+        """Mark the display as stale - called from monitor threads"""
+        self._update_queue.put(True)
+            
+    def _drain_updates(self):
+        """Redraw once for all updates since the last poll and report monitor errors
+        
+        The next poll is scheduled even if this one fails, so a single bad update
+        doesn't stop the display for the rest of the session.
+        """
+        try:
+            pending = False
+            try:
+                while True:
+                    self._update_queue.get_nowait()
+                    pending = True
+            except queue.Empty:
+                pass
+            if pending:
+                started = time.perf_counter()
+                self.update_display()
+                self._update_durations.append(time.perf_counter() - started)
+                average_ms = sum(self._update_durations) / len(self._update_durations) * 1000
+                self._update_poll_ms = min(max(self.UPDATE_POLL_MS, int(average_ms * 2)), self.UPDATE_POLL_MAX_MS)
+                
+            if self._refresh_thread and not self._refresh_thread.is_alive():
+                self._refresh_done()
+                
+            # Show the latest monitor error, if any were recorded since the last poll
+            errors = drain_errors()
+            if errors:
+                self.update_status(errors[-1][1])
+        finally:
+            self.root.after(self._update_poll_ms, self._drain_updates)
+        
     def refresh_stats(self):
-        """Refresh statistics by re-parsing the log file"""
-        if not self.log_file_path or not os.path.exists(self.log_file_path):
+        """Refresh statistics by re-parsing the log file in the background"""
+        if self._refresh_thread:
+            return  # A refresh is already running
+        if not self._log_file_exists:
             self.update_status("No valid log file selected")
             return
             
+        self.refresh_button.configure(state="disabled")
+        self.update_status("Refreshing statistics...")
+        self._refresh_error = None
+        self._refresh_thread = threading.Thread(target=self._refresh_worker, daemon=True)
+        self._refresh_thread.start()
+        
+    def _refresh_worker(self):
+        """Re-parse the log file - runs on the refresh thread, finished by _drain_updates"""
         try:
             self.parser.reset_stats()
             self.parser.parse_file(self.log_file_path, start_from_end=False)
-            self.update_display()
-            self.update_status("Statistics refreshed")
         except Exception as e:
-            self.update_status(f"Error reading log file: {str(e)}")
-            messagebox.showerror("Error", f"Failed to read log file:\\n{str(e)}")
+            self._refresh_error = e
+        self._notify_update()
+        
+    def _refresh_done(self):
+        """Report the outcome of a finished background refresh"""
+        self._refresh_thread = None
+        self.refresh_button.configure(state="normal")
+        if self._refresh_error is None:
+            self.update_status("Statistics refreshed")
+        else:
+            self.update_status(f"Error reading log file: {str(self._refresh_error)}")
+            messagebox.showerror("Error", f"Failed to read log file:\\n{str(self._refresh_error)}")
             
     def reset_stats(self):
         """Reset all statistics"""
@@ -471,101 +616,147 @@ C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"""
         self.update_display()
         self.update_status("Statistics reset")
         
+    # NO-NUMBA: Tk calls and string formatting, a JIT has nothing to speed up here
     def update_display(self):
         """Update all display elements with current stats"""
-        stats = self.parser.stats
-        
-        # Update session information
-        self.player_name_var.set(stats.session.player_name or "Unknown")
-        self.player_geid_var.set(stats.session.player_geid or "N/A")
-        
-        self.game_version_var.set(stats.session.game_version or "N/A")
-        self.branch_var.set(stats.session.branch or "N/A")
-        self.map_name_var.set(stats.session.map_name or "N/A")
-        
-        uptime_hours = stats.session.uptime_seconds / 3600 if stats.session.uptime_seconds else 0
-        self.uptime_var.set(f"{uptime_hours:.1f} hours")
-        
-        # Update inventory information with transaction tracking
-        self.total_earned_var.set(f"{stats.inventory.total_money_earned:,.0f} aUEC")
-        self.total_spent_var.set(f"{stats.inventory.total_money_spent:,.0f} aUEC")
-        
-        # Color the profit based on positive/negative
-        net_profit = stats.inventory.net_profit
-        profit_text = f"{net_profit:,.0f} aUEC"
-        self.net_profit_var.set(profit_text)
-        
-        # Set profit label color based on value
-        if net_profit > 0:
-            self.profit_label.configure(text_color="green")
-        elif net_profit < 0:
-            self.profit_label.configure(text_color="red")
-        else:
-            self.profit_label.configure(text_color="white")
-        
-        # Update item counts
-        self.items_purchased_var.set(str(stats.inventory.total_items_purchased))
-        self.items_sold_var.set(str(stats.inventory.total_items_sold))
-        self.total_transactions_var.set(str(len(stats.inventory.transactions)))
-        
-        # Update recent transactions display
-        recent_transactions = self.parser.get_recent_transactions(10)  # Last 10 transactions
-        if recent_transactions:
-            # Add header
-            header = " Time    | Action | Qty   | Item Name                          | Amount            | Location\n"
-            header += "-" * 118 + "\n"
+        # Copy what is shown while holding the parser lock, so monitor threads can't
+        # change it halfway through, and release it before the slower Tk calls
+        with self.parser.lock:
+            stats = self.parser.stats
+            session = copy.copy(stats.session)
+            inventory = copy.copy(stats.inventory)
+            missions = copy.copy(stats.missions)
+            recent_transactions = self.parser.get_recent_transactions(10, newest_first=True)  # Last 10 transactions
+            recent_missions = self.parser.get_recent_missions(15, newest_first=True)  # Last 15 missions
+        
+        # Update session information - these rarely change, so their labels are set
+        # directly rather than through a traced Tcl variable
+        self._set_option(self.player_name_label, 'text', session.player_name or "Unknown")
+        self._set_option(self.player_geid_label, 'text', session.player_geid or "N/A")
+        
+        self._set_option(self.game_version_label, 'text', session.game_version or "N/A")
+        self._set_option(self.branch_label, 'text', session.branch or "N/A")
+        self._set_option(self.map_name_label, 'text', session.map_name or "N/A")
+        
+        uptime_hours = session.uptime_seconds / 3600 if session.uptime_seconds else 0
+        self._set_var(self.uptime_var, f"{uptime_hours:.1f} hours")
+        
+        # Tabs not opened yet have no widgets to update
+        if self._tabs_built['Inventory']:
+            # Update inventory information with transaction tracking
+            self._set_var(self.total_earned_var, _format_auec(inventory.total_money_earned))
+            self._set_var(self.total_spent_var, _format_auec(inventory.total_money_spent))
             
-            transactions_text = header
-            for trans in reversed(recent_transactions):  # Most recent first
-                time_str = trans.timestamp.strftime('%H:%M:%S') if trans.timestamp else 'Unknown'
-                action = "BOUGHT" if trans.transaction_type == "purchase" else "SOLD"
-                total_cost = trans.price * trans.quantity
-                # Truncate item name and location to fit in 30 characters
-                item_name_display = trans.item_name[:34] if len(trans.item_name) > 34 else trans.item_name
-                location_display = trans.location[:34] if len(trans.location) > 34 else trans.location
-                transactions_text += f"{time_str} | {action:6} | {trans.quantity:5} | {item_name_display:<34} | {total_cost:>12,.0f} aUEC | {location_display:<34}\n"
+            # Color the profit based on positive/negative
+            net_profit = inventory.net_profit
+            self._set_var(self.net_profit_var, _format_auec(net_profit))
             
-            # Update the textbox
-            self.transactions_text.delete("0.0", "end")
-            self.transactions_text.insert("0.0", transactions_text)
-        else:
-            self.transactions_text.delete("0.0", "end")
-            self.transactions_text.insert("0.0", "No recent transactions")
-        
-        # Update mission information
-        self.missions_completed_var.set(str(stats.missions.missions_completed))
-        self.missions_abandoned_var.set(str(stats.missions.missions_abandoned))
-        self.missions_failed_var.set(str(stats.missions.missions_failed))
-        self.total_missions_var.set(str(len(stats.missions.missions)))
-        
-        # Set color coding for mission counters
-        self.completed_label.configure(text_color="green")
-        self.abandoned_label.configure(text_color="orange")
-        self.failed_label.configure(text_color="red")
-        
-        # Update recent missions display
-        recent_missions = self.parser.get_recent_missions(15)  # Last 15 missions
-        if recent_missions:
-            # Add header
-            header = " Time    | Status     | Player         | Reason                      | Mission ID\n"
-            header += "-" * 105 + "\n"
+            # Set profit label color based on value
+            if net_profit > 0:
+                self._set_option(self.profit_label, 'text_color', "green")
+            elif net_profit < 0:
+                self._set_option(self.profit_label, 'text_color', "red")
+            else:
+                self._set_option(self.profit_label, 'text_color', "white")
             
-            missions_text = header
-            for mission in reversed(recent_missions):  # Most recent first
-                time_str = mission.timestamp.strftime('%H:%M:%S') if mission.timestamp else 'Unknown'
-                status = mission.completion_type
-                player_display = mission.player_name[:14] if len(mission.player_name) > 14 else mission.player_name
-                reason_display = mission.reason[:26] if len(mission.reason) > 26 else mission.reason
-                mission_id_display = mission.mission_id[:8] + "..." if len(mission.mission_id) > 8 else mission.mission_id
-                
-                missions_text += f"{time_str} | {status:<10} | {player_display:<14} | {reason_display:<26} | {mission_id_display}\n"
+            # Update item counts
+            self._set_var(self.items_purchased_var, str(inventory.total_items_purchased))
+            self._set_var(self.items_sold_var, str(inventory.total_items_sold))
+            self._set_var(self.total_transactions_var, str(inventory.total_transactions))
+            
+            # Update recent transactions display
+            self._shown_transaction = self._update_recent_text(
+                self.transactions_text,
+                recent_transactions,
+                self._shown_transaction,
+                TRANSACTIONS_HEADER,
+                self._format_transaction_row,
+                "No recent transactions"
+            )
             
-            # Update the textbox
-            self.missions_text.delete("0.0", "end")
-            self.missions_text.insert("0.0", missions_text)
+        if self._tabs_built['Missions']:
+            # Update mission information
+            self._set_var(self.missions_completed_var, str(missions.missions_completed))
+            self._set_var(self.missions_abandoned_var, str(missions.missions_abandoned))
+            self._set_var(self.missions_failed_var, str(missions.missions_failed))
+            self._set_var(self.total_missions_var, str(missions.total_missions))
+            
+            # Update recent missions display
+            self._shown_mission = self._update_recent_text(
+                self.missions_text,
+                recent_missions,
+                self._shown_mission,
+                MISSIONS_HEADER,
+                self._format_mission_row,
+                "No recent missions"
+            )
+        
+    def _update_recent_text(self, textbox, records: list, shown, header: str,
+                            format_row: Callable, empty_text: str):
+        """Bring a recent records textbox up to date - returns the newest record shown
+        
+        records are newest first and shown is the newest record drawn by the last call.
+        Only the rows appended since then are inserted at the "rows" mark below the
+        header, and the oldest rows beyond len(records) dropped. The whole text is only
+        redrawn when that record is no longer among the recent ones, e.g. after a reset
+        or a burst of events.
+        """
+        newest = records[0] if records else None
+        if newest is shown:
+            return shown  # Nothing new since the last update
+        
+        new_rows = []
+        for record in records:
+            if record is shown:
+                textbox.insert("rows", "".join(new_rows))
+                textbox.delete(f"rows + {len(records)} lines", "end")
+                return newest
+            new_rows.append(format_row(record))
+        
+        textbox.delete("0.0", "end")
+        if records:
+            textbox.insert("0.0", header)
+            # Left gravity keeps the mark in front of the rows inserted at it
+            textbox.mark_set("rows", "end - 1 chars")
+            textbox.mark_gravity("rows", "left")
+            textbox.insert("rows", "".join(new_rows))
         else:
-            self.missions_text.delete("0.0", "end")
-            self.missions_text.insert("0.0", "No recent missions")
+            textbox.insert("0.0", empty_text)
+        return newest
+        
+    @staticmethod
+    def _format_transaction_row(trans) -> str:
+        """Format one row of the recent transactions table
+        
+        Columns are padded with str.ljust()/rjust() and joined, rather than going through
+        a format spec per field. Item name and location come truncated by the parser.
+        """
+        action = "BOUGHT" if trans.transaction_type == "purchase" else "SOLD"
+        amount = _format_auec(trans.price * trans.quantity).rjust(17)
+        return " | ".join((trans.time_str, action.ljust(6), str(trans.quantity).rjust(5),
+                           trans.display_item.ljust(DISPLAY_NAME_WIDTH), amount,
+                           trans.display_location.ljust(DISPLAY_NAME_WIDTH))) + "\n"
+        
+    @staticmethod
+    def _format_mission_row(mission) -> str:
+        """Format one row of the recent missions table, the same way as transactions"""
+        return " | ".join((mission.time_str, mission.completion_type.ljust(10),
+                           mission.player_name[:14].ljust(14), mission.reason[:26].ljust(26),
+                           mission.display_id)) + "\n"
+        
+    def _set_var(self, var: tk.StringVar, value: str):
+        """Set a display variable, skipping the Tcl round trip when the value is unchanged"""
+        key = str(var)
+        if self._shown_values.get(key) != value:
+            self._shown_values[key] = value
+            var.set(value)
+            
+    def _set_option(self, widget, option: str, value: str):
+        """Configure an option of a widget, unless it already has that value"""
+        key = (str(widget), option)
+        if self._shown_values.get(key) != value:
+            self._shown_values[key] = value
+            widget.configure(**{option: value})
         
     def update_status(self, message: str):
         """Update status bar message"""